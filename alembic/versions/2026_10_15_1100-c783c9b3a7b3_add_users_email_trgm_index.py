@@ -0,0 +1,38 @@
+"""add_users_email_trgm_index
+
+Revision ID: c783c9b3a7b3
+Revises: 20493b352d9b
+Create Date: 2026-10-15 11:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c783c9b3a7b3"
+down_revision: Union[str, None] = "20493b352d9b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "users_email_trgm_idx",
+        "users",
+        ["email"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"email": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "users_email_trgm_idx",
+        table_name="users",
+        postgresql_using="gin",
+        postgresql_ops={"email": "gin_trgm_ops"},
+    )
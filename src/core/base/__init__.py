@@ -1,3 +1,4 @@
+from src.core.base.insert_queue import *
 from src.core.base.repository import *
 from src.core.base.schemas import *
 from src.core.base.service import *
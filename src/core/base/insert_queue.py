@@ -0,0 +1,209 @@
+"""Модуль для пакетной вставки записей, накопленных из отдельных запросов."""
+
+import asyncio
+from contextlib import suppress
+from typing import Any, Callable
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import src.core.base.types as types
+from src.core.database import SessionLocal
+from src.core.settings import settings
+
+
+class AsyncInsertQueueClosedError(RuntimeError):
+    """Запись не была добавлена в БД, так как очередь остановлена или упала."""
+
+
+class AsyncInsertQueue:
+    """
+    Очередь для пакетной вставки записей одной модели.
+
+    Записи, поступившие в течение `ASYNC_INSERT_WAIT_TIME_MS` миллисекунд,
+    но не более `ASYNC_INSERT_MAX_ROWS`, добавляются в БД одним INSERT
+    в отдельной сессии с одним коммитом на весь пакет.
+
+    **Вставка выполняется вне транзакции запроса и не откатывается вместе с ней.**
+
+    Args:
+        repository: Репозиторий для работы с моделью.
+        session_factory: Фабрика сессий для вставки пакетов.
+    """
+
+    _queues: dict[type, "AsyncInsertQueue"] = {}
+
+    def __init__(
+        self,
+        repository,
+        session_factory: Callable[[], AsyncSession] = SessionLocal,
+    ):
+        self.repository = repository
+        self._session_factory = session_factory
+        self._queue: asyncio.Queue[tuple[dict[str, Any], asyncio.Future]] = (
+            asyncio.Queue()
+        )
+        self._task: asyncio.Task | None = None
+
+    @classmethod
+    def get_for_repository(cls, repository) -> "AsyncInsertQueue":
+        """
+        Получить очередь для репозитория, создав ее при первом обращении.
+
+        Args:
+            repository: Репозиторий для работы с моделью.
+
+        Returns:
+            AsyncInsertQueue: очередь для вставки записей модели репозитория.
+        """
+
+        if repository not in cls._queues:
+            cls._queues[repository] = cls(repository)
+
+        return cls._queues[repository]
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Остановить все очереди, например при остановке приложения."""
+
+        for queue in cls._queues.values():
+            await queue.close()
+
+    async def submit(self, data: dict[str, Any]) -> types.ModelType:
+        """
+        Добавить запись в очередь и дождаться ее вставки в БД.
+
+        Args:
+            data (dict[str, Any]): данные для создания модели.
+
+        Returns:
+            ModelType: созданный экземпляр модели.
+
+        Raises:
+            IntegrityError: Запись нарушает ограничения БД.
+            AsyncInsertQueueClosedError: Очередь остановлена до вставки записи.
+        """
+
+        # Задача пересоздается, если она еще не запущена или была остановлена
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._collect())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((data, future))
+
+        return await future
+
+    async def close(self) -> None:
+        """
+        Остановить сбор пакетов.
+
+        Вызовы, ожидающие вставки записей, завершаются
+        с `AsyncInsertQueueClosedError`.
+        """
+
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        while not self._queue.empty():
+            self._fail_pending([self._queue.get_nowait()])
+
+    async def _collect(self) -> None:
+        """Собирать записи из очереди в пакеты и добавлять их в БД."""
+
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch: list[tuple[dict[str, Any], asyncio.Future]] = []
+            try:
+                batch.append(await self._queue.get())
+                deadline = loop.time() + settings.ASYNC_INSERT_WAIT_TIME_MS / 1000
+
+                while len(batch) < settings.ASYNC_INSERT_MAX_ROWS:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(self._queue.get(), timeout),
+                        )
+                    except asyncio.TimeoutError:
+                        break
+
+                await self._flush(batch)
+
+            # Ошибка одного пакета не должна останавливать сбор следующих
+            except Exception as ex:
+                logger.error("Ошибка пакетной вставки: {}", ex)
+
+            finally:
+                self._fail_pending(batch)
+
+    async def _flush(self, batch: list[tuple[dict[str, Any], asyncio.Future]]) -> None:
+        """
+        Добавить пакет записей в БД и передать результат ожидающим вызовам.
+
+        Если пакет не удалось добавить целиком, записи добавляются по одной,
+        чтобы ошибка одной записи не затрагивала остальные.
+
+        Args:
+            batch (list[tuple[dict[str, Any], Future]]): данные и ожидающие их вызовы.
+        """
+
+        try:
+            objects_db = await self._insert([data for data, _ in batch])
+
+        except Exception as ex:
+            if len(batch) == 1:
+                _, future = batch[0]
+                if not future.done():
+                    future.set_exception(ex)
+                return
+
+            for item in batch:
+                await self._flush([item])
+            return
+
+        for (_, future), obj_db in zip(batch, objects_db):
+            if not future.done():
+                future.set_result(obj_db)
+
+    async def _insert(self, data: list[dict[str, Any]]) -> list[types.ModelType]:
+        """
+        Добавить записи в БД в отдельной сессии с одним коммитом.
+
+        Если коммит не выполнен, транзакция откатывается при закрытии сессии.
+
+        Args:
+            data (list[dict[str, Any]]): список данных для создания моделей.
+
+        Returns:
+            list[ModelType]: список созданных моделей в порядке переданных данных.
+        """
+
+        async with self._session_factory() as session:
+            objects_db = await self.repository.create_bulk(
+                session=session,
+                data=data,
+            )
+            await session.commit()
+
+        return objects_db
+
+    @staticmethod
+    def _fail_pending(batch: list[tuple[dict[str, Any], asyncio.Future]]) -> None:
+        """
+        Завершить с ошибкой вызовы, которые не получили результат,
+        чтобы они не ожидали его бесконечно.
+
+        Args:
+            batch (list[tuple[dict[str, Any], Future]]): данные и ожидающие их вызовы.
+        """
+
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(
+                    AsyncInsertQueueClosedError("Запись не была добавлена в БД."),
+                )
@@ -1,15 +1,50 @@
 """Модуль интерфейсов для CRUD операций с моделям БД."""
 
+from functools import lru_cache
 from typing import Any, Generic, Tuple
 
-from sqlalchemy import Select, asc, delete, desc, insert, or_, select, update
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    asc,
+    bindparam,
+    delete,
+    desc,
+    insert,
+    lambda_stmt,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncScalarResult, AsyncSession
+from sqlalchemy.orm import raiseload
 from sqlalchemy.sql import func
 
 import src.core.base.types as types
 from src.core import constants
 
 
+@lru_cache(maxsize=128)
+def _ilike_clause(model, field_names: tuple[str, ...]) -> ColumnElement[bool]:
+    """
+    Получить условие поиска с использованием ilike по набору полей модели.
+
+    Значения передаются параметрами `s_<поле>`, поэтому условие
+    зависит только от модели и полей и кэшируется между запросами.
+
+    Args:
+        model: модель SQLAlchemy.
+        field_names (tuple[str, ...]): отсортированные имена полей для поиска.
+
+    Returns:
+        ColumnElement[bool]: условие поиска.
+    """
+
+    return or_(
+        *(getattr(model, field).ilike(bindparam(f"s_{field}")) for field in field_names)
+    )
+
+
 class BaseRepository(
     Generic[
         types.ModelType,
@@ -26,6 +61,84 @@ class BaseRepository(
 
     model = None
 
+    # MARK: Utils
+    @classmethod
+    def _get_load_options(cls, eager: list | None = None) -> list:
+        """
+        Получить опции загрузки связей для запроса.
+
+        По умолчанию ленивая загрузка связей запрещена через `raiseload('*')`,
+        поэтому обращение к незагруженной связи сразу выбрасывает исключение.
+
+        Args:
+            eager (list | None): опции загрузки связей, например `selectinload`.
+
+        Returns:
+            list: опции загрузки для `Select.options`.
+        """
+
+        return [raiseload("*"), *(eager or [])]
+
+    @classmethod
+    def _validate_bulk_keys(cls, data: list[dict[str, Any]]) -> None:
+        """
+        Проверить, что все записи содержат одинаковый набор полей модели.
+
+        Args:
+            data (list[dict[str, Any]]): список данных для создания моделей.
+
+        Raises:
+            ValueError: Записи содержат разные наборы полей или поля,
+                отсутствующие в модели.
+        """
+
+        if not data:
+            return
+
+        keys = data[0].keys()
+        unknown_keys = keys - cls.model.__table__.columns.keys()
+        if unknown_keys:
+            raise ValueError(
+                f"Поля {sorted(unknown_keys)} отсутствуют в модели {cls.model.__name__}"
+            )
+
+        for index, row in enumerate(data):
+            if row.keys() != keys:
+                raise ValueError(
+                    f"Запись {index} содержит поля {sorted(row)}, "
+                    f"ожидаются поля {sorted(keys)}"
+                )
+
+    @classmethod
+    def _get_ilike_filter(
+        cls,
+        search_fields: dict[str, Any],
+    ) -> tuple[ColumnElement[bool] | None, dict[str, str]]:
+        """
+        Получить условие поиска с использованием ilike и параметры для него.
+
+        Поля сортируются по имени, а значения передаются именованными
+        параметрами, поэтому скомпилированный запрос зависит только
+        от набора полей и переиспользуется из кэша SQLAlchemy.
+        Само условие для набора полей берется из кэша `_ilike_clause`.
+
+        Args:
+            search_fields (dict[str, Any]): поля для поиска.
+
+        Returns:
+            tuple[ColumnElement[bool] | None, dict[str, str]]:
+                условие поиска или `None`, если поля не заданы, и параметры запроса.
+        """
+
+        if not search_fields:
+            return None, {}
+
+        fields = tuple(sorted(search_fields))
+        condition = _ilike_clause(cls.model, fields)
+        params = {f"s_{field}": f"%{search_fields[field]}%" for field in fields}
+
+        return condition, params
+
     # MARK: Create
     @classmethod
     async def create(
@@ -52,8 +165,9 @@ class BaseRepository(
         else:
             create_data = obj_in.model_dump(exclude_unset=True)
 
-        stmt = insert(cls.model).values(**create_data).returning(cls.model)
-        result = await session.execute(stmt)
+        # Данные передаются параметрами, а не через `values()`, как и в `create_bulk`
+        stmt = insert(cls.model).returning(cls.model)
+        result = await session.execute(stmt, [create_data])
 
         return result.scalars().one()
 
@@ -71,20 +185,102 @@ class BaseRepository(
             data (list[dict[str, Any]]): список данных для создания моделей.
 
         Returns:
-            list[ModelType]: список созданных моделей.
+            list[ModelType]: список созданных моделей в порядке переданных данных.
         """
 
-        stmt = insert(cls.model).returning(cls.model)
+        stmt = (
+            insert(cls.model)
+            .returning(cls.model, sort_by_parameter_order=True)
+            .execution_options(populate_existing=True)
+        )
         result = await session.execute(stmt, data)
 
         return result.scalars().all()
 
+    @classmethod
+    async def create_bulk_copy(
+        cls,
+        session: AsyncSession,
+        data: list[dict[str, Any]],
+    ) -> int:
+        """
+        Добавить большое количество записей в текущую сессию.
+
+        Начиная с `BULK_COPY_THRESHOLD` записей используется
+        `COPY FROM STDIN` в бинарном формате, для меньших объемов - обычный INSERT.
+
+        COPY не поддерживает RETURNING, поэтому созданные модели не возвращаются.
+        Если они нужны, следует использовать `create_bulk`.
+
+        Args:
+            session (AsyncSession): текущая сессия.
+            data (list[dict[str, Any]]): список данных для создания моделей.
+
+        Returns:
+            int: количество добавленных записей.
+
+        Raises:
+            ValueError: Записи содержат разные наборы полей или поля,
+                отсутствующие в модели.
+        """
+
+        cls._validate_bulk_keys(data)
+
+        if len(data) < constants.BULK_COPY_THRESHOLD:
+            if data:
+                await session.execute(insert(cls.model), data)
+            return len(data)
+
+        # COPY применяет только серверные значения по умолчанию,
+        # поэтому значения по умолчанию на стороне Python подставляются вручную
+        columns = [
+            column
+            for column in cls.model.__table__.columns
+            if column.key in data[0]
+            or (
+                column.default is not None
+                and (column.default.is_scalar or column.default.is_callable)
+            )
+        ]
+        records = [
+            tuple(
+                row[column.key]
+                if column.key in row
+                else (
+                    column.default.arg(None)
+                    if column.default.is_callable
+                    else column.default.arg
+                )
+                for column in columns
+            )
+            for row in data
+        ]
+
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        # asyncpg открывает транзакцию только при первом запросе,
+        # а COPY должен выполняться внутри транзакции текущей сессии
+        if not driver_connection.is_in_transaction():
+            await connection.exec_driver_sql("SELECT 1")
+
+        await driver_connection.copy_records_to_table(
+            cls.model.__tablename__,
+            records=records,
+            columns=[column.name for column in columns],
+            schema_name=cls.model.__table__.schema,
+        )
+
+        return len(records)
+
     # MARK: Get
     @classmethod
     async def get_one_or_none(
         cls,
         session: AsyncSession,
         *filter,
+        eager: list | None = None,
         **filter_by,
     ) -> types.ModelType | None:
         """
@@ -93,6 +289,7 @@ class BaseRepository(
         Args:
             session (AsyncSession): текущая сессия.
             *filter: фильтры для запроса.
+            eager (list | None): опции загрузки связей, например `selectinload`.
             **filter_by: фильтры для запроса.
 
         Returns:
@@ -100,7 +297,12 @@ class BaseRepository(
                 Найденная модель данных или `None`, если совпадений не было найдено.
         """
 
-        stmt = select(cls.model).filter(*filter).filter_by(**filter_by)
+        stmt = (
+            select(cls.model)
+            .options(*cls._get_load_options(eager))
+            .filter(*filter)
+            .filter_by(**filter_by)
+        )
         result = await session.execute(stmt)
 
         return result.scalars().one_or_none()
@@ -112,6 +314,7 @@ class BaseRepository(
         offset: int = constants.DEFAULT_QUERY_OFFSET,
         limit: int = constants.DEFAULT_QUERY_LIMIT,
         *filter,
+        eager: list | None = None,
         **filter_by,
     ) -> list[types.ModelType]:
         """
@@ -123,19 +326,34 @@ class BaseRepository(
             offset (int): смещение для пагинации.
             limit (int): количество записей для пагинации.
             *filter: фильтры для запроса.
+            eager (list | None): опции загрузки связей, например `selectinload`.
             **filter_by: фильтры для запроса.
 
         Returns:
             list[ModelType]: модели, соответствующие параметрам поиска.
         """
 
-        stmt = (
-            select(cls.model)
-            .filter(*filter)
-            .filter_by(**filter_by)
-            .offset(offset)
-            .limit(limit)
+        # Построение выражения кэшируется SQLAlchemy для каждого набора
+        # фильтров и опций, а значения передаются параметрами.
+        # Условия `filter_by` не создаются отдельными lambda в цикле,
+        # так как они разделяли бы одну переменную замыкания
+        model = cls.model
+        load_options = tuple(cls._get_load_options(eager))
+        criteria = (
+            *filter,
+            *(getattr(model, key) == value for key, value in filter_by.items()),
         )
+        stmt = lambda_stmt(
+            lambda: select(model).options(*load_options),
+            track_on=[model, load_options],
+        )
+        if criteria:
+            stmt = stmt.add_criteria(
+                lambda s: s.where(*criteria),
+                track_on=[criteria],
+            )
+        stmt += lambda s: s.offset(offset).limit(limit)
+
         result = await session.execute(stmt)
 
         return result.scalars().all()
@@ -166,15 +384,12 @@ class BaseRepository(
 
         stmt = select(cls.model).filter(*filter).filter_by(**filter_by)
 
-        if search_fields:
-            search_conditions = []
-            for field, value in search_fields.items():
-                search_conditions.append(getattr(cls.model, field).ilike(f"%{value}%"))
-            if search_conditions:
-                stmt = stmt.filter(or_(*search_conditions))
+        search_condition, params = cls._get_ilike_filter(search_fields)
+        if search_condition is not None:
+            stmt = stmt.filter(search_condition)
 
         stmt = stmt.offset(offset).limit(limit)
-        result = await session.execute(stmt)
+        result = await session.execute(stmt, params)
 
         return result.scalars().all()
 
@@ -186,6 +401,7 @@ class BaseRepository(
         ascending: bool = True,
         limit: int | None = None,
         *filter,
+        eager: list | None = None,
         **filter_by,
     ) -> list[types.ModelType]:
         """
@@ -199,6 +415,7 @@ class BaseRepository(
             ascending (bool): флаг для сортировки по возрастанию.
             limit (int | None): количество записей для пагинации.
             *filter: фильтры для запроса.
+            eager (list | None): опции загрузки связей, например `selectinload`.
             **filter_by: фильтры для запроса.
 
         Returns:
@@ -208,6 +425,7 @@ class BaseRepository(
         sort_order = asc(sort_field) if ascending else desc(sort_field)
         stmt = (
             select(cls.model)
+            .options(*cls._get_load_options(eager))
             .filter(sort_field.isnot(None))
             .filter(*filter)
             .filter_by(**filter_by)
@@ -247,6 +465,38 @@ class BaseRepository(
 
         return result.scalars().all()
 
+    @classmethod
+    async def stream_page(
+        cls,
+        session: AsyncSession,
+        stmt: Select[Tuple[types.ModelType]],
+        limit: int | None,
+        offset: int | None,
+    ) -> AsyncScalarResult[types.ModelType]:
+        """
+        Применить пагинацию к финальному выражению для запроса в БД
+        и вернуть поток сущностей, загружаемых частями
+        по `STREAM_YIELD_PER` записей.
+
+        Args:
+            session (AsyncSession): текущая сессия.
+            stmt (Select[Tuple[ModelType]]): финальное выражение для запроса в БД.
+            limit (int | None): количество записей для пагинации.
+            offset (int | None): смещение для пагинации.
+
+        Returns:
+            AsyncScalarResult[ModelType]:
+                асинхронный поток моделей, соответствующих параметрам поиска.
+        """
+
+        stmt = (
+            stmt.limit(limit=limit)
+            .offset(offset=offset)
+            .execution_options(yield_per=constants.STREAM_YIELD_PER)
+        )
+
+        return await session.stream_scalars(stmt)
+
     @classmethod
     async def get_all_non_scalars_with_pagination_from_stmt(
         cls,
@@ -276,6 +526,44 @@ class BaseRepository(
 
         return result.all()
 
+    @classmethod
+    async def get_page_with_total(
+        cls,
+        session: AsyncSession,
+        limit: int | None,
+        offset: int | None,
+        stmt: Select[Tuple[types.ModelType]],
+    ) -> tuple[list[types.ModelType], int]:
+        """
+        Применить пагинацию к финальному выражению для запроса в БД
+        и получить страницу сущностей вместе с их общим количеством
+        за один запрос, используя оконную функцию `COUNT(*) OVER()`.
+
+        Args:
+            session (AsyncSession): текущая сессия.
+            limit (int | None): количество записей для пагинации.
+            offset (int | None): смещение для пагинации.
+            stmt (Select[Tuple[ModelType]]): финальное выражение для запроса в БД.
+
+        Returns:
+            (models, total_count): модели, соответствующие параметрам поиска,
+                с учетом пагинации и общее количество сущностей без ее учета
+                или 0, если совпадений не найдено.
+        """
+
+        stmt = (
+            stmt.add_columns(func.count().over().label("_total"))
+            .limit(limit=limit)
+            .offset(offset=offset)
+        )
+        result = await session.execute(stmt)
+        rows = result.all()
+
+        if not rows:
+            return [], 0
+
+        return [row[0] for row in rows], rows[0][-1]
+
     # MARK: Update
     @classmethod
     async def update(
@@ -296,6 +584,9 @@ class BaseRepository(
 
         Returns:
             ModelType: обновленный экземпляр модели.
+
+        Raises:
+            NoResultFound: запись, соответствующая критериям, не найдена.
         """
 
         if isinstance(obj_in, dict):
@@ -303,8 +594,14 @@ class BaseRepository(
         else:
             update_data = obj_in.model_dump(exclude_unset=True, exclude_none=True)
 
+        # Объект может уже находиться в сессии,
+        # поэтому его атрибуты перезаписываются значениями из RETURNING
         stmt = (
-            update(cls.model).where(*where).values(**update_data).returning(cls.model)
+            update(cls.model)
+            .where(*where)
+            .values(**update_data)
+            .returning(cls.model)
+            .execution_options(populate_existing=True)
         )
         result = await session.execute(stmt)
 
@@ -327,7 +624,11 @@ class BaseRepository(
             list[ModelType](list[Base]): список обновленных  моделей.
         """
 
-        stmt = update(cls.model).returning(cls.model)
+        stmt = (
+            update(cls.model)
+            .returning(cls.model)
+            .execution_options(populate_existing=True)
+        )
         result = await session.execute(stmt, data)
 
         return result.scalars().all()
@@ -339,7 +640,7 @@ class BaseRepository(
         *filter,
         session: AsyncSession,
         **filter_by,
-    ):
+    ) -> int:
         """
         Удалить запись, соответствующую критериям.
 
@@ -347,10 +648,15 @@ class BaseRepository(
             session (AsyncSession): текущая сессия.
             *filter: фильтры для запроса.
             **filter_by: фильтры для запроса.
+
+        Returns:
+            rows_count: количество удаленных строк.
         """
 
         stmt = delete(cls.model).filter(*filter).filter_by(**filter_by)
-        await session.execute(stmt)
+        result = await session.execute(stmt)
+
+        return result.rowcount
 
     # MARK: Count
     @classmethod
@@ -406,18 +712,16 @@ class BaseRepository(
             rows_count: количество найденных строк или 0 если совпадений не найдено.
         """
 
-        stmt = select(cls.model).filter(*filter).filter_by(**filter_by)
+        subquery = select(cls.model.id).filter(*filter).filter_by(**filter_by)
 
-        if search_fields:
-            search_conditions = []
-            for field, value in search_fields.items():
-                search_conditions.append(getattr(cls.model, field).ilike(f"%{value}%"))
-            if search_conditions:
-                stmt = stmt.filter(or_(*search_conditions))
+        search_condition, params = cls._get_ilike_filter(search_fields)
+        if search_condition is not None:
+            subquery = subquery.filter(search_condition)
 
-        result = await session.execute(stmt)
+        stmt = select(func.count()).select_from(subquery.subquery())
+        result = await session.execute(stmt, params)
 
-        return len(result.scalars().all())
+        return result.scalar() or 0
 
     @classmethod
     async def count_subquery(
@@ -1,15 +1,16 @@
 """Модуль для интерфейсов сервисов, выполняющих CRUD операции."""
 
 import uuid
-from typing import Generic, TypeVar
+from typing import Generic, TypeVar, get_origin
 
-from pydantic import BaseModel
-from sqlalchemy.exc import IntegrityError
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.core.base.types as types
 from src.core import exceptions
-from src.core.base import BaseRepository
+from src.core.base import AsyncInsertQueue, BaseRepository
+from src.core.settings import settings
 
 
 class BaseService(
@@ -25,6 +26,14 @@ class BaseService(
     """
     Основной класс интерфейсов для сервисов, выполняющих CRUD операции.
 
+    Методы сервиса не коммитят транзакцию, а только выполняют `flush`.
+    Коммит выполняется один раз за запрос зависимостью `get_uow`.
+    Исключение - `create` при включенном `ASYNC_INSERT`: объект добавляется
+    в отдельной транзакции очереди и не откатывается вместе с запросом.
+
+    Связи моделей не загружаются лениво и должны быть запрошены явно
+    через параметр `eager` методов получения репозитория.
+
     Args:
         repository: Репозиторий для работы с моделью.
     """
@@ -35,9 +44,28 @@ class BaseService(
         types.UpdateSchemaType,
     ]
 
+    _get_schema: type[BaseModel]
+    _get_list_schema: type[BaseModel]
+    _get_list_adapter: TypeAdapter
+    _get_list_json_adapter: TypeAdapter
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Классы схем определяются один раз при создании сервиса,
+        # а не при каждом вызове CRUD методов
+        orig_bases = cls.__dict__.get("__orig_bases__", ())
+        if orig_bases and get_origin(orig_bases[0]) is BaseService:
+            cls._get_schema = cls.get_schema_class_by_type(types.GetSchemaType)
+            cls._get_list_schema = cls.get_schema_class_by_type(
+                types.GetListSchemaType,
+            )
+            cls._get_list_adapter = TypeAdapter(list[cls._get_schema])
+            cls._get_list_json_adapter = TypeAdapter(cls._get_list_schema)
+
     # MARK: Utils
     @classmethod
-    async def get_schema_class_by_type(cls, type_var: TypeVar) -> type[BaseModel]:
+    def get_schema_class_by_type(cls, type_var: TypeVar) -> type[BaseModel]:
         """
         Получить класс схемы по типу.
 
@@ -69,6 +97,10 @@ class BaseService(
         """
         Создать объект в БД.
 
+        Если включен `ASYNC_INSERT`, объект добавляется в БД пакетом вместе
+        с объектами из других запросов в отдельной транзакции,
+        которая коммитится независимо от `get_uow`.
+
         Args:
             session (AsyncSession): Сессия для работы с базой данных.
             data (CreateSchemaType): Данные для создания объекта.
@@ -81,16 +113,20 @@ class BaseService(
         """
 
         try:
-            # Добавление объекта в БД
-            obj_db = await cls.repository.create(
-                session=session,
-                obj_in=data,
-            )
-            await session.commit()
+            # Добавление объекта в БД пакетом вместе с другими запросами
+            if settings.ASYNC_INSERT:
+                queue = AsyncInsertQueue.get_for_repository(cls.repository)
+                obj_db = await queue.submit(data.model_dump(exclude_unset=True))
 
-            schema_class = await cls.get_schema_class_by_type(types.GetSchemaType)
+            # Добавление объекта в БД
+            else:
+                obj_db = await cls.repository.create(
+                    session=session,
+                    obj_in=data,
+                )
+                await session.flush()
 
-            return schema_class.model_validate(obj_db)
+            return cls._get_schema.model_validate(obj_db)
 
         except IntegrityError as ex:
             raise exceptions.ConflictException(exc=ex)
@@ -122,8 +158,7 @@ class BaseService(
         if obj_db is None:
             raise exceptions.NotFoundException()
 
-        schema_class = await cls.get_schema_class_by_type(types.GetSchemaType)
-        return schema_class.model_validate(obj_db)
+        return cls._get_schema.model_validate(obj_db)
 
     @classmethod
     async def get_all(
@@ -146,10 +181,71 @@ class BaseService(
             NotFoundException: Объекты не найдены.
         """
 
-        base_stmt = await cls.repository.get_stmt_by_query(
+        objects_schema, objects_count = await cls._get_page(session, query_params)
+
+        return cls._get_list_schema(
+            count=objects_count,
+            data=objects_schema,
+        )
+
+    @classmethod
+    async def get_all_json(
+        cls,
+        session: AsyncSession,
+        query_params: types.GetQuerySchemaType,
+    ) -> bytes:
+        """
+        Получить список объектов и их общее количество в виде JSON
+        с фильтрацией по query параметрам, отличным от None.
+
+        Схема списка собирается без повторной валидации
+        и сериализуется сразу в байты.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            query_params (GetQuerySchemaType): Query параметры для фильтрации.
+
+        Returns:
+            bytes: JSON со списком объектов и их общим количеством.
+
+        Raises:
+            NotFoundException: Объекты не найдены.
+        """
+
+        objects_schema, objects_count = await cls._get_page(session, query_params)
+
+        return cls._get_list_json_adapter.dump_json(
+            cls._get_list_schema.model_construct(
+                count=objects_count,
+                data=objects_schema,
+            ),
+        )
+
+    @classmethod
+    async def _get_page(
+        cls,
+        session: AsyncSession,
+        query_params: types.GetQuerySchemaType,
+    ) -> tuple[list[types.GetSchemaType], int]:
+        """
+        Получить страницу объектов в виде схем и их общее количество.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            query_params (GetQuerySchemaType): Query параметры для фильтрации.
+
+        Returns:
+            tuple[list[GetSchemaType], int]: список объектов и их общее количество.
+
+        Raises:
+            NotFoundException: Объекты не найдены.
+        """
+
+        base_stmt = cls.repository.get_stmt_by_query(
             query_params=query_params,
         )
-        objects_db = await cls.repository.get_all_with_pagination_from_stmt(
+        # Страница объектов и их общее количество получаются одним запросом
+        objects_db, objects_count = await cls.repository.get_page_with_total(
             session=session,
             limit=query_params.limit,
             offset=query_params.offset,
@@ -159,22 +255,13 @@ class BaseService(
         if not objects_db:
             raise exceptions.NotFoundException()
 
-        objects_count = await cls.repository.count_subquery(
-            session=session,
-            stmt=base_stmt,
+        # Преобразуем все объекты в схемы за один вызов валидации
+        objects_schema = cls._get_list_adapter.validate_python(
+            objects_db,
+            from_attributes=True,
         )
 
-        # Получаем класс схемы для одного объекта
-        item_schema_class = await cls.get_schema_class_by_type(types.GetSchemaType)
-        # Преобразуем каждый объект в схему
-        objects_schema = [item_schema_class.model_validate(obj) for obj in objects_db]
-
-        # Получаем класс схемы для списка и создаем его экземпляр
-        list_schema_class = await cls.get_schema_class_by_type(types.GetListSchemaType)
-        return list_schema_class(
-            count=objects_count,
-            data=objects_schema,
-        )
+        return objects_schema, objects_count
 
     # MARK: Update
     @classmethod
@@ -200,23 +287,22 @@ class BaseService(
             ConflictException: Объект с такими данными уже существует.
         """
 
-        # Поиск объекта в БД
-        await cls.get_by_id(session=session, id=id)
-
-        # Обновление объекта в БД
+        # Обновление объекта в БД, отсутствие объекта определяется по RETURNING
         try:
             updated_obj = await cls.repository.update(
                 cls.repository.model.id == id,
                 session=session,
                 obj_in=data,
             )
-            await session.commit()
+            await session.flush()
+
+        except NoResultFound:
+            raise exceptions.NotFoundException()
 
         except IntegrityError as ex:
             raise exceptions.ConflictException(exc=ex)
 
-        schema_class = await cls.get_schema_class_by_type(types.GetSchemaType)
-        return schema_class.model_validate(updated_obj)
+        return cls._get_schema.model_validate(updated_obj)
 
     # MARK: Delete
     @classmethod
@@ -236,12 +322,13 @@ class BaseService(
             NotFoundException: Объект не найден.
         """
 
-        # Поиск объекта в БД
-        await cls.get_by_id(session=session, id=id)
-
         # Удаление объекта из БД
-        await cls.repository.delete(
+        deleted_count = await cls.repository.delete(
             id=id,
             session=session,
         )
-        await session.commit()
+
+        if deleted_count == 0:
+            raise exceptions.NotFoundException()
+
+        await session.flush()
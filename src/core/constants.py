@@ -7,6 +7,8 @@ from src.core import constants
 # MARK: Security
 AUTH_HEADER_NAME: str = "Authorization"
 ALGORITHM: str = "HS256"
+LOGIN_CACHE_TTL_SECONDS: int = 30
+LOGIN_CACHE_MAX_SIZE: int = 10_000
 
 CORS_HEADERS: list[str] = [
     "Content-Type",
@@ -24,6 +26,9 @@ CORS_METHODS: list[str] = [
     "PUT",
 ]
 
+# MARK: Request
+JSON_THREADPOOL_THRESHOLD: int = 262_144
+
 # MARK: Database
 DB_NAMING_CONVENTION = {
     "ix": "ix_%(column_0_label)s",
@@ -35,3 +40,6 @@ DB_NAMING_CONVENTION = {
 CURRENT_TIMESTAMP_UTC: TextClause = text("(CURRENT_TIMESTAMP AT TIME ZONE 'UTC')")
 DEFAULT_QUERY_OFFSET: int = 0
 DEFAULT_QUERY_LIMIT: int = 100
+BULK_COPY_THRESHOLD: int = 500
+INSERTMANYVALUES_PAGE_SIZE: int = 1000
+STREAM_YIELD_PER: int = 200
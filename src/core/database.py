@@ -1,5 +1,7 @@
 """Модуль конфигурации базы данных."""
 
+import uuid
+
 from sqlalchemy import MetaData, NullPool
 from sqlalchemy.ext.asyncio import (
     AsyncAttrs,
@@ -9,6 +11,7 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import DeclarativeBase
 
+from src.core import constants
 from src.core.settings import settings
 
 DB_NAMING_CONVENTION = {
@@ -31,10 +34,31 @@ class Base(AsyncAttrs, DeclarativeBase):
     metadata = MetaData(naming_convention=DB_NAMING_CONVENTION)
 
 
+if settings.POSTGRES_PGBOUNCER:
+    # Соединения распределяет PgBouncer в режиме transaction, поэтому
+    # пул приложения не нужен, а подготовленные выражения не кэшируются
+    # и получают уникальные имена, так как соединение может смениться
+    engine_options = {
+        "poolclass": NullPool,
+        "connect_args": {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        },
+    }
+else:
+    engine_options = {
+        "pool_size": settings.POSTGRES_POOL_SIZE,
+        "max_overflow": settings.POSTGRES_MAX_OVERFLOW,
+        "pool_recycle": settings.POSTGRES_POOL_RECYCLE,
+        "pool_timeout": settings.POSTGRES_POOL_TIMEOUT,
+    }
+
 engine = create_async_engine(
     settings.DATABASE_URL,
-    poolclass=NullPool,
     pool_pre_ping=True,
+    insertmanyvalues_page_size=constants.INSERTMANYVALUES_PAGE_SIZE,
+    **engine_options,
 )
 
 SessionLocal = async_sessionmaker(
@@ -24,7 +24,7 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     Выполняет `rollback` текущей транзакции, в случае любого исключения.
     Сессия закрывается внутри контекстного менеджера автоматически.
 
-    **Коммит транзакции должен быть выполнен явно.**
+    **Коммит транзакции должен быть выполнен явно или через `get_uow`.**
     """
 
     async with SessionLocal() as session:
@@ -35,6 +35,21 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             raise ex
 
 
+async def get_uow(
+    session: AsyncSession = Depends(get_session),
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    AsyncGenerator экземпляра `AsyncSession` для единицы работы запроса.
+
+    Сервисы выполняют только `flush`, а коммит транзакции выполняется
+    один раз после успешной обработки запроса.
+    В случае исключения транзакция откатывается в `get_session`.
+    """
+
+    yield session
+    await session.commit()
+
+
 # MARK: Auth
 async def get_current_user(
     header_value: str = Depends(oauth2_scheme),
@@ -57,7 +72,7 @@ async def get_current_user(
     try:
         payload = jwt.decode(
             jwt=token,
-            key=settings.JWT_ACCESS_SECRET,
+            key=settings.JWT_ACCESS_SECRET_BYTES,
             algorithms=[constants.ALGORITHM],
         )
         user_id = payload.get("id")
@@ -1,17 +1,27 @@
 """Обработчики исключений"""
 
-from fastapi import HTTPException, Request
-from fastapi.responses import ORJSONResponse
+import orjson
+from fastapi import HTTPException, Request, Response, status
 from loguru import logger
 
+INTERNAL_SERVER_ERROR_CONTENT: bytes = orjson.dumps(
+    {"detail": "Внутренняя ошибка сервера"},
+)
+
 
 async def http_exception_handler(request: Request, exc: HTTPException):
-    logger.warning(f"HTTP исключение: {exc.detail}")
-    return ORJSONResponse(status_code=exc.status_code, content={"detail": exc.detail})
+    logger.warning("HTTP исключение: {}", exc.detail)
+    return Response(
+        content=orjson.dumps({"detail": exc.detail}),
+        status_code=exc.status_code,
+        media_type="application/json",
+    )
 
 
 async def exception_handler(request: Request, exc: Exception):
-    logger.error(f"Исключение: {exc}")
-    return ORJSONResponse(
-        status_code=500, content={"detail": "Внутренняя ошибка сервера"}
+    logger.error("Исключение: {}", exc)
+    return Response(
+        content=INTERNAL_SERVER_ERROR_CONTENT,
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        media_type="application/json",
     )
@@ -7,12 +7,20 @@ from loguru import logger
 
 
 def configure_logger() -> None:
-    """Настройки логгера loguru."""
+    """
+    Настройки логгера loguru.
+
+    Записи передаются в фоновый поток через очередь (`enqueue=True`),
+    поэтому вывод логов не блокирует цикл событий.
+    """
     logger.remove(0)
     logger.add(
         sys.stdout,
         format="<green>{level:<8}</green>  <cyan>{time:DD.MM.YYYY HH:mm:ss}</cyan>  <blue>{message}</blue>",  # noqa
         level="INFO",
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
     )
 
 
@@ -22,16 +30,28 @@ def setup_logging():
     configure_logger()
 
     class InterceptHandler(logging.Handler):
+        # Уровень и глубина стека вычисляются один раз
+        # для каждого уровня и места вызова логгера
+        _levels: dict[str, str | int] = {}
+        _depths: dict[tuple[str, int], int] = {}
+
         def emit(self, record):
-            try:
-                level = logger.level(record.levelname).name
-            except ValueError:
-                level = record.levelno
-
-            frame, depth = logging.currentframe(), 2
-            while frame.f_code.co_filename == logging.__file__:
-                frame = frame.f_back
-                depth += 1
+            level = self._levels.get(record.levelname)
+            if level is None:
+                try:
+                    level = logger.level(record.levelname).name
+                except ValueError:
+                    level = record.levelno
+                self._levels[record.levelname] = level
+
+            call_site = (record.pathname, record.lineno)
+            depth = self._depths.get(call_site)
+            if depth is None:
+                frame, depth = logging.currentframe(), 2
+                while frame.f_code.co_filename == logging.__file__:
+                    frame = frame.f_back
+                    depth += 1
+                self._depths[call_site] = depth
 
             logger.opt(depth=depth, exception=record.exc_info).log(
                 level, record.getMessage()
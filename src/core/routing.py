@@ -0,0 +1,41 @@
+"""Модуль для классов маршрутов."""
+
+from typing import Any, Callable, Coroutine
+
+import orjson
+from fastapi import Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.routing import APIRoute
+
+from src.core import constants
+
+
+class ORJSONRequest(Request):
+    """
+    Запрос, тело которого декодируется с помощью orjson.
+
+    Тела от `JSON_THREADPOOL_THRESHOLD` байт декодируются в пуле потоков,
+    меньшие — сразу, так как переход в пул потоков дороже самого декодирования.
+    """
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            body = await self.body()
+            if len(body) < constants.JSON_THREADPOOL_THRESHOLD:
+                self._json = orjson.loads(body)
+            else:
+                self._json = await run_in_threadpool(orjson.loads, body)
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """Маршрут, передающий в обработчик `ORJSONRequest`."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        route_handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request) -> Response:
+            request = ORJSONRequest(request.scope, request.receive)
+            return await route_handler(request)
+
+        return orjson_route_handler
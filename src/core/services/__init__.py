@@ -1 +1,2 @@
 from src.core.services.hash_service import *
+from src.core.services.login_cache_service import *
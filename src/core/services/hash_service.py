@@ -1,19 +1,84 @@
 """Модуль для работы с хеш-функциями."""
 
 import hashlib
+import hmac
+import secrets
+
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 
 
 class HashService:
-    """Класс для работы с хеш-функциями."""
+    """
+    Класс для работы с хеш-функциями.
+
+    Пароли хэшируются с помощью argon2id с фиксированными параметрами
+    стоимости. Для проверки также поддерживаются хэши SHA-256,
+    созданные до перехода на argon2id, которые заменяются
+    при следующей успешной авторизации (см. `needs_rehash`).
+    """
+
+    _hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
 
-    def generate(input: str) -> str:
+    # Хэш для проверки пароля, когда пользователь не найден,
+    # чтобы время ответа не зависело от наличия пользователя
+    dummy_hash: str = _hasher.hash(secrets.token_hex(16))
+
+    @classmethod
+    def generate(cls, input: str | bytes) -> str:
         """
         Сгенерировать хэш строки.
 
         Args:
-            input (str): Строка для хэширования.
+            input (str | bytes): Строка для хэширования.
 
         Returns:
             str: Хэш строки.
         """
-        return hashlib.sha256(input.encode()).hexdigest()
+
+        return cls._hasher.hash(input)
+
+    @classmethod
+    def verify(cls, hash: str, input: str | bytes) -> bool:
+        """
+        Проверить, что строка соответствует хэшу.
+
+        Args:
+            hash (str): Хэш строки.
+            input (str | bytes): Строка для проверки.
+
+        Returns:
+            bool: Соответствует ли строка хэшу.
+        """
+
+        # Хэши SHA-256, созданные до перехода на argon2id
+        if not hash.startswith("$argon2"):
+            if isinstance(input, str):
+                input = input.encode()
+            return hmac.compare_digest(hash, hashlib.sha256(input).hexdigest())
+
+        try:
+            return cls._hasher.verify(hash, input)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    @classmethod
+    def needs_rehash(cls, hash: str) -> bool:
+        """
+        Проверить, нужно ли пересоздать хэш: он создан до перехода
+        на argon2id или с другими параметрами стоимости.
+
+        Args:
+            hash (str): Хэш строки.
+
+        Returns:
+            bool: Нужно ли пересоздать хэш.
+        """
+
+        if not hash.startswith("$argon2"):
+            return True
+
+        try:
+            return cls._hasher.check_needs_rehash(hash)
+        except InvalidHashError:
+            return True
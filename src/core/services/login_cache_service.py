@@ -0,0 +1,152 @@
+"""Модуль для кэширования успешных авторизаций."""
+
+import hmac
+import secrets
+import uuid
+
+from cachetools import TTLCache
+
+from src.core import constants
+
+
+class LoginCacheService:
+    """
+    Класс для кэширования успешных авторизаций.
+
+    Повторная авторизация с теми же данными в течение
+    `LOGIN_CACHE_TTL_SECONDS` секунд не требует проверки пароля.
+    Пароль и его хэш хранятся только в виде HMAC с ключом,
+    создаваемым при запуске процесса.
+
+    Кэш локален для процесса, поэтому при попадании в кэш пользователь
+    должен быть перепроверен по БД через `is_current`: изменение данных
+    в другом процессе сбрасывает кэш только в нем самом.
+    """
+
+    _secret: bytes = secrets.token_bytes(32)
+    _cache: TTLCache = TTLCache(
+        maxsize=constants.LOGIN_CACHE_MAX_SIZE,
+        ttl=constants.LOGIN_CACHE_TTL_SECONDS,
+    )
+    _keys_by_user: TTLCache = TTLCache(
+        maxsize=constants.LOGIN_CACHE_MAX_SIZE,
+        ttl=constants.LOGIN_CACHE_TTL_SECONDS,
+    )
+
+    @classmethod
+    def _get_key(cls, email: str, password: str | bytes) -> tuple[str, bytes]:
+        """
+        Получить ключ кэша для данных авторизации.
+
+        Args:
+            email (str): Электронная почта пользователя.
+            password (str | bytes): Пароль пользователя.
+
+        Returns:
+            tuple[str, bytes]: Ключ кэша.
+        """
+
+        if isinstance(password, str):
+            password = password.encode()
+        return email, hmac.digest(cls._secret, password, "sha256")
+
+    @classmethod
+    def _get_fingerprint(cls, hashed_password: str) -> bytes:
+        """
+        Получить отпечаток хэша пароля для сравнения с данными из БД.
+
+        Args:
+            hashed_password (str): Хэш пароля пользователя.
+
+        Returns:
+            bytes: Отпечаток хэша пароля.
+        """
+
+        return hmac.digest(cls._secret, hashed_password.encode(), "sha256")
+
+    @classmethod
+    def get(
+        cls,
+        email: str,
+        password: str | bytes,
+    ) -> tuple[uuid.UUID, bytes] | None:
+        """
+        Получить ID пользователя и отпечаток хэша его пароля по данным авторизации.
+
+        Args:
+            email (str): Электронная почта пользователя.
+            password (str | bytes): Пароль пользователя.
+
+        Returns:
+            tuple[uuid.UUID, bytes] | None: ID пользователя и отпечаток хэша пароля
+                или `None`, если данных нет в кэше.
+        """
+
+        return cls._cache.get(cls._get_key(email, password))
+
+    @classmethod
+    def is_current(
+        cls,
+        fingerprint: bytes,
+        email: str,
+        user_email: str,
+        user_hashed_password: str,
+    ) -> bool:
+        """
+        Проверить, что данные пользователя в БД не изменились
+        с момента сохранения авторизации в кэш.
+
+        Args:
+            fingerprint (bytes): Отпечаток хэша пароля из кэша.
+            email (str): Электронная почта из данных авторизации.
+            user_email (str): Электронная почта пользователя в БД.
+            user_hashed_password (str): Хэш пароля пользователя в БД.
+
+        Returns:
+            bool: Актуальна ли авторизация из кэша.
+        """
+
+        return email == user_email and hmac.compare_digest(
+            fingerprint,
+            cls._get_fingerprint(user_hashed_password),
+        )
+
+    @classmethod
+    def set(
+        cls,
+        email: str,
+        password: str | bytes,
+        user_id: uuid.UUID,
+        hashed_password: str,
+    ) -> None:
+        """
+        Сохранить ID пользователя и отпечаток хэша его пароля
+        для данных авторизации.
+
+        Args:
+            email (str): Электронная почта пользователя.
+            password (str | bytes): Пароль пользователя.
+            user_id (uuid.UUID): ID пользователя.
+            hashed_password (str): Хэш пароля пользователя.
+        """
+
+        key = cls._get_key(email, password)
+        cls._cache[key] = user_id, cls._get_fingerprint(hashed_password)
+
+        # Ключи пользователя сохраняются для сброса кэша при изменении данных
+        user_id = str(user_id)
+        keys = cls._keys_by_user.get(user_id, set())
+        keys.add(key)
+        cls._keys_by_user[user_id] = keys
+
+    @classmethod
+    def invalidate(cls, user_id: uuid.UUID | str) -> None:
+        """
+        Удалить из кэша все данные авторизации пользователя.
+
+        Args:
+            user_id (uuid.UUID | str): ID пользователя.
+        """
+
+        for key in cls._keys_by_user.pop(str(user_id), ()):
+            cls._cache.pop(key, None)
@@ -1,5 +1,6 @@
 """Настройки конфигурации основного API."""
 
+from functools import cached_property
 from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -20,6 +21,16 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str
     POSTGRES_HOST: str
     POSTGRES_PORT: str
+    POSTGRES_POOL_SIZE: int = 20
+    POSTGRES_MAX_OVERFLOW: int = 40
+    POSTGRES_POOL_RECYCLE: int = 300
+    POSTGRES_POOL_TIMEOUT: int = 5
+    POSTGRES_PGBOUNCER: bool = False
+
+    # Async insert
+    ASYNC_INSERT: bool = False
+    ASYNC_INSERT_WAIT_TIME_MS: int = 50
+    ASYNC_INSERT_MAX_ROWS: int = 100
 
     # JWT
     JWT_ACCESS_SECRET: str
@@ -27,7 +38,15 @@ class Settings(BaseSettings):
     JWT_ACCESS_EXPIRE_MINUTES: int
     JWT_REFRESH_EXPIRE_MINUTES: int
 
-    @property
+    @cached_property
+    def JWT_ACCESS_SECRET_BYTES(self) -> bytes:
+        return self.JWT_ACCESS_SECRET.encode()
+
+    @cached_property
+    def JWT_REFRESH_SECRET_BYTES(self) -> bytes:
+        return self.JWT_REFRESH_SECRET.encode()
+
+    @cached_property
     def DATABASE_URL(self):
         return (
             f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
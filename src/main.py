@@ -1,9 +1,13 @@
 """Основной модуль для конфигурации FastAPI."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-from src.core import constants, handlers, middlewares
+from src.core import constants, handlers
+from src.core.base import AsyncInsertQueue
 from src.core.logger import setup_logging
 from src.core.settings import settings
 from src.modules.auth import auth_router
@@ -21,7 +25,6 @@ def setup_middlewares(app: FastAPI) -> None:
         allow_methods=constants.CORS_METHODS,
         allow_headers=constants.CORS_HEADERS,
     )
-    app.add_middleware(middlewares.ORJSONRequestMiddleware)
 
 
 def setup_exception_handlers(app: FastAPI) -> None:
@@ -43,12 +46,27 @@ def setup_routers(app: FastAPI) -> None:
         app.include_router(router=router, prefix="/api/v1")
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Жизненный цикл приложения."""
+
+    yield
+
+    # Ожидающие пакетной вставки вызовы завершаются с ошибкой, а не зависают
+    await AsyncInsertQueue.close_all()
+
+
 app = FastAPI(
     title="FastAPI Template",
     version=settings.APP_VERSION,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 setup_logging()
 setup_middlewares(app)
 setup_exception_handlers(app)
 setup_routers(app)
+
+# Схема OpenAPI строится один раз при запуске и кэшируется в `app.openapi_schema`
+app.openapi()
@@ -1,14 +1,19 @@
 """Модуль для маршрутов авторизации пользователей."""
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.modules.auth.schemas as auth_schemas
 import src.modules.users.schemas as user_schemas
 from src.core import dependencies
+from src.core.routing import ORJSONRoute
 from src.modules.auth.services import AuthService, JWTService
 
-auth_router = APIRouter(prefix="/auth", tags=["Авторизация"])
+auth_router = APIRouter(
+    prefix="/auth",
+    tags=["Авторизация"],
+    route_class=ORJSONRoute,
+)
 
 
 # MARK: Post
@@ -16,11 +21,12 @@ auth_router = APIRouter(prefix="/auth", tags=["Авторизация"])
     "/register",
     summary="Зарегистрировать пользователя.",
     status_code=status.HTTP_201_CREATED,
+    response_model=auth_schemas.JWTGetSchema,
 )
 async def register_route(
     schema: user_schemas.UserCreateSchema,
-    session: AsyncSession = Depends(dependencies.get_session),
-) -> auth_schemas.JWTGetSchema:
+    session: AsyncSession = Depends(dependencies.get_uow),
+) -> Response:
     """
     Зарегистрировать пользователя.
 
@@ -30,7 +36,13 @@ async def register_route(
         UserAlreadyExistsException: Пользователь уже существует.
     """
 
-    return await AuthService.register(session, schema)
+    tokens = await AuthService.register(session, schema)
+
+    return Response(
+        content=tokens.model_dump_json(),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json",
+    )
 
 
 # MARK: Patch
@@ -38,11 +50,12 @@ async def register_route(
     "/login",
     summary="Авторизовать пользователя.",
     status_code=status.HTTP_200_OK,
+    response_model=auth_schemas.JWTGetSchema,
 )
 async def login_route(
     schema: user_schemas.UserLoginSchema,
-    session: AsyncSession = Depends(dependencies.get_session),
-) -> auth_schemas.JWTGetSchema:
+    session: AsyncSession = Depends(dependencies.get_uow),
+) -> Response:
     """
     Авторизовать пользователя.
 
@@ -52,18 +65,25 @@ async def login_route(
         UserNotFoundException: Пользователь не найден.
     """
 
-    return await AuthService.login(session, schema)
+    tokens = await AuthService.login(session, schema)
+
+    return Response(
+        content=tokens.model_dump_json(),
+        status_code=status.HTTP_200_OK,
+        media_type="application/json",
+    )
 
 
 @auth_router.patch(
     "/refresh",
     summary="Обновить access_token и refresh_token.",
     status_code=status.HTTP_200_OK,
+    response_model=auth_schemas.JWTGetSchema,
 )
 async def refresh_tokens_route(
     tokens_data: auth_schemas.JWTRefreshSchema,
     session: AsyncSession = Depends(dependencies.get_session),
-) -> auth_schemas.JWTGetSchema:
+) -> Response:
     """
     Получить `access_token` и `refresh_token`, передав верный `refresh_token`.
 
@@ -75,4 +95,10 @@ async def refresh_tokens_route(
         UserNotFoundException: Пользователь не найден.
     """
 
-    return await JWTService.refresh_tokens(session, tokens_data)
+    tokens = await JWTService.refresh_tokens(session, tokens_data)
+
+    return Response(
+        content=tokens.model_dump_json(),
+        status_code=status.HTTP_200_OK,
+        media_type="application/json",
+    )
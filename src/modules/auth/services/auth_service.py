@@ -1,14 +1,15 @@
 """Модуль для работы с авторизацией пользователей"""
 
+from fastapi.concurrency import run_in_threadpool
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.modules.auth.schemas as auth_schemas
 import src.modules.users.schemas as user_schemas
 from src.core import exceptions
-from src.core.services import HashService
+from src.core.services import HashService, LoginCacheService
 from src.modules.auth.services.jwt_service import JWTService
-from src.modules.users import UserRepository, UserService
+from src.modules.users import UserModel, UserRepository, UserService
 
 
 class AuthService:
@@ -35,7 +36,7 @@ class AuthService:
             UserAlreadyExistsException: Пользователь с такими данными уже существует.
         """
 
-        logger.info(f"Регистрация пользователя: {schema}")
+        logger.info("Регистрация пользователя: {}", schema.email)
 
         # Создание пользователя
         user = await UserService.create(session, schema)
@@ -55,6 +56,9 @@ class AuthService:
         """
         Авторизовать пользователя.
 
+        Устаревший хэш пароля заменяется в текущей сессии,
+        коммит выполняется зависимостью `get_uow`.
+
         Args:
             session (AsyncSession): Сессия для работы с базой данных.
             schema (UserLoginSchema): данные для авторизации пользователя.
@@ -66,21 +70,63 @@ class AuthService:
             NotFoundException: Пользователь не найден.
         """
 
-        logger.info(f"Авторизация пользователя: {schema}")
+        logger.info("Авторизация пользователя: {}", schema.email)
+
+        # Повторная авторизация с теми же данными. Кэш локален для процесса,
+        # поэтому данные пользователя перепроверяются по первичному ключу
+        cached = LoginCacheService.get(schema.email, schema.password_bytes)
+        if cached is not None:
+            user_id, fingerprint = cached
+            user = await UserRepository.get_one_or_none(session=session, id=user_id)
+            if user is not None and LoginCacheService.is_current(
+                fingerprint,
+                schema.email,
+                user.email,
+                user.hashed_password,
+            ):
+                return await JWTService.create_tokens(user_id=user.id)
 
-        # Хэширование пароля
-        hashed_password = HashService.generate(schema.password)
+            LoginCacheService.invalidate(user_id)
 
         # Поиск пользователя в БД
         user = await UserRepository.get_one_or_none(
             session=session,
             email=schema.email,
-            hashed_password=hashed_password,
         )
 
-        if user is None:
+        # Проверка пароля выполняется и для несуществующего пользователя.
+        # argon2 освобождает GIL, поэтому проверка выполняется в пуле потоков
+        hashed_password = (
+            user.hashed_password if user is not None else HashService.dummy_hash
+        )
+        is_valid = await run_in_threadpool(
+            HashService.verify,
+            hashed_password,
+            schema.password_bytes,
+        )
+        if not is_valid or user is None:
             raise exceptions.NotFoundException()
 
+        # Устаревший хэш пароля заменяется на argon2id с текущими параметрами
+        if HashService.needs_rehash(user.hashed_password):
+            logger.info("Обновление хэша пароля пользователя: {}", user.id)
+            hashed_password = await run_in_threadpool(
+                HashService.generate,
+                schema.password_bytes,
+            )
+            user = await UserRepository.update(
+                UserModel.id == user.id,
+                session=session,
+                obj_in={"hashed_password": hashed_password},
+            )
+
+        LoginCacheService.set(
+            schema.email,
+            schema.password_bytes,
+            user.id,
+            user.hashed_password,
+        )
+
         # Создание токенов
         tokens = await JWTService.create_tokens(user_id=user.id)
 
@@ -17,7 +17,7 @@ class JWTService:
 
     # MARK: Utils
     @classmethod
-    async def _decode_refresh_token(cls, refresh_token: str) -> str:
+    def _decode_refresh_token(cls, refresh_token: str) -> str:
         """
         Декодировать refresh_token.
 
@@ -36,7 +36,7 @@ class JWTService:
         try:
             payload = jwt.decode(
                 jwt=refresh_token,
-                key=settings.JWT_REFRESH_SECRET,
+                key=settings.JWT_REFRESH_SECRET_BYTES,
                 algorithms=[constants.ALGORITHM],
             )
             user_id = payload.get("id")
@@ -53,7 +53,7 @@ class JWTService:
 
     # MARK: Create
     @classmethod
-    async def _create_token(
+    def _create_token(
         cls,
         user_id: str,
         token_type: Literal["access_token", "refresh_token"],
@@ -72,10 +72,10 @@ class JWTService:
 
         if token_type == "access_token":
             expires_delta = settings.JWT_ACCESS_EXPIRE_MINUTES
-            secret_key = settings.JWT_ACCESS_SECRET
+            secret_key = settings.JWT_ACCESS_SECRET_BYTES
         else:
             expires_delta = settings.JWT_REFRESH_EXPIRE_MINUTES
-            secret_key = settings.JWT_REFRESH_SECRET
+            secret_key = settings.JWT_REFRESH_SECRET_BYTES
 
         expires_at = datetime.now(timezone.utc) + timedelta(minutes=expires_delta)
 
@@ -102,11 +102,11 @@ class JWTService:
             schemas.JWTGetSchema: Схема с access и refresh токенами.
         """
 
-        access_token, expires_at = await cls._create_token(
+        access_token, expires_at = cls._create_token(
             user_id=user_id,
             token_type="access_token",
         )
-        refresh_token, _ = await cls._create_token(
+        refresh_token, _ = cls._create_token(
             user_id=user_id,
             token_type="refresh_token",
         )
@@ -143,7 +143,7 @@ class JWTService:
 
         refresh_token = tokens_data.refresh_token.removeprefix("Bearer ")
 
-        user_id = await cls._decode_refresh_token(refresh_token=refresh_token)
+        user_id = cls._decode_refresh_token(refresh_token=refresh_token)
 
         user_db = await UserRepository.get_one_or_none(
             session=session,
@@ -1,18 +1,27 @@
 """Модуль для маршрутов проверки состояния работы API."""
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Response, status
 
+from src.core.routing import ORJSONRoute
 from src.modules.healthcheck.schemas import HealthCheckSchema
 
-health_check_router = APIRouter(prefix="/health_check", tags=["Health Check"])
+health_check_router = APIRouter(
+    prefix="/health_check",
+    tags=["Health Check"],
+    route_class=ORJSONRoute,
+)
+
+# Ответ не меняется во время работы API, поэтому сериализуется один раз
+HEALTH_CHECK_CONTENT: bytes = HealthCheckSchema().model_dump_json().encode()
 
 
 @health_check_router.get(
     path="",
     summary="Проверить состояние работы API",
     status_code=status.HTTP_200_OK,
+    response_model=HealthCheckSchema,
 )
-async def health_check() -> HealthCheckSchema:
+async def health_check() -> Response:
     """Проверить состояние работы API."""
 
-    return HealthCheckSchema()
+    return Response(content=HEALTH_CHECK_CONTENT, media_type="application/json")
@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import TIMESTAMP
+from sqlalchemy import TIMESTAMP, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core import constants
@@ -14,6 +14,15 @@ class UserModel(Base):
     """SQLAlchemy модель пользователя."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Триграммный индекс для поиска по email с использованием ilike
+        Index(
+            "users_email_trgm_idx",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         default=uuid.uuid4,
@@ -1,13 +1,19 @@
 """Модуль для репозиториев пользователей."""
 
-from typing import Tuple
+from typing import Any, Tuple
 
 from sqlalchemy import Select, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.modules.users.schemas as schemas
 from src.core.base import BaseRepository
 from src.modules.users.models import UserModel
 
+# Сортировка пользователей по дате создания
+ORDER_BY_CREATED_AT_ASC = UserModel.created_at.asc()
+ORDER_BY_CREATED_AT_DESC = UserModel.created_at.desc()
+
 
 class UserRepository(
     BaseRepository[
@@ -24,7 +30,43 @@ class UserRepository(
     model = UserModel
 
     @classmethod
-    async def get_stmt_by_query(
+    async def create(
+        cls,
+        session: AsyncSession,
+        obj_in: schemas.UserCreateRepositorySchema | dict[str, Any],
+    ) -> UserModel | None:
+        """
+        Добавить пользователя в текущую сессию.
+
+        Конфликт по email не прерывает транзакцию,
+        а определяется по отсутствию строки в RETURNING.
+
+        Args:
+            session (AsyncSession): текущая сессия.
+            obj_in (UserCreateRepositorySchema | dict[str, Any]):
+                данные для создания пользователя.
+
+        Returns:
+            UserModel | None: созданный пользователь или None,
+                если пользователь с таким email уже существует.
+        """
+
+        if isinstance(obj_in, dict):
+            create_data = obj_in
+        else:
+            create_data = obj_in.model_dump(exclude_unset=True)
+
+        stmt = (
+            insert(UserModel)
+            .on_conflict_do_nothing(index_elements=[UserModel.email])
+            .returning(UserModel)
+        )
+        result = await session.execute(stmt, [create_data])
+
+        return result.scalars().one_or_none()
+
+    @classmethod
+    def get_stmt_by_query(
         cls,
         query_params: schemas.UsersQuerySchema,
     ) -> Select[Tuple[UserModel]]:
@@ -48,15 +90,12 @@ class UserRepository(
 
         # Фильтрация статусу пользователя на платформе.
         if query_params.is_admin is not None:
-            if query_params.is_admin:
-                stmt = stmt.where(UserModel.is_admin.is_(True))
-            else:
-                stmt = stmt.where(UserModel.is_admin.is_(False))
+            stmt = stmt.where(UserModel.is_admin == query_params.is_admin)
 
         # Сортировка по дате создания.
         if not query_params.asc:
-            stmt = stmt.order_by(UserModel.created_at.desc())
+            stmt = stmt.order_by(ORDER_BY_CREATED_AT_DESC)
         else:
-            stmt = stmt.order_by(UserModel.created_at)
+            stmt = stmt.order_by(ORDER_BY_CREATED_AT_ASC)
 
         return stmt
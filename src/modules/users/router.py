@@ -1,16 +1,18 @@
 """Модуль для маршрутов пользователей."""
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.modules.users.schemas as schemas
 from src.core import dependencies
+from src.core.routing import ORJSONRoute
 from src.modules.users.models import UserModel
 from src.modules.users.service import UserService
 
 user_router = APIRouter(
     prefix="/users",
     tags=["Пользователи"],
+    route_class=ORJSONRoute,
 )
 
 
@@ -64,7 +66,7 @@ async def get_user_by_id_route(
 async def get_users_by_admin_route(
     query_params: schemas.UsersQuerySchema = Query(),
     session: AsyncSession = Depends(dependencies.get_session),
-) -> schemas.UserListGetSchema:
+) -> Response:
     """
     Получить список пользователей и их общее количество
     с фильтрацией по query параметрам, отличным от None.
@@ -72,7 +74,10 @@ async def get_users_by_admin_route(
     Доступно только администратору.
     """
 
-    return await UserService.get_all(session, query_params)
+    return Response(
+        content=await UserService.get_all_json(session, query_params),
+        media_type="application/json",
+    )
 
 
 # MARK: Post
@@ -84,7 +89,7 @@ async def get_users_by_admin_route(
 )
 async def create_user_by_admin_route(
     data: schemas.UserCreateAdminSchema,
-    session: AsyncSession = Depends(dependencies.get_session),
+    session: AsyncSession = Depends(dependencies.get_uow),
 ) -> schemas.UserGetAdminSchema:
     """
     Создать нового пользователя.
@@ -105,7 +110,7 @@ async def create_user_by_admin_route(
 )
 async def update_user_route(
     data: schemas.UserUpdateSchema,
-    session: AsyncSession = Depends(dependencies.get_session),
+    session: AsyncSession = Depends(dependencies.get_uow),
     user: UserModel = Depends(dependencies.get_current_user),
 ) -> schemas.UserGetSchema:
     """
@@ -127,7 +132,7 @@ async def update_user_route(
 async def update_user_by_admin_route(
     id: str,
     data: schemas.UserUpdateAdminSchema,
-    session: AsyncSession = Depends(dependencies.get_session),
+    session: AsyncSession = Depends(dependencies.get_uow),
 ) -> schemas.UserGetAdminSchema:
     """
     Обновить данные пользователя.
@@ -147,7 +152,7 @@ async def update_user_by_admin_route(
 )
 async def delete_user_by_admin_route(
     id: str,
-    session: AsyncSession = Depends(dependencies.get_session),
+    session: AsyncSession = Depends(dependencies.get_uow),
 ):
     """
     Удалить пользователя.
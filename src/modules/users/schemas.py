@@ -1,9 +1,11 @@
 """Модуль для Pydantic схем пользователей."""
 
 import uuid
+from functools import cached_property
 
 from pydantic import (
     BaseModel,
+    ConfigDict,
     Field,
 )
 
@@ -14,13 +16,11 @@ from src.core.base import DataListReadBaseSchema, PaginationBaseSchema
 class UserGetSchema(BaseModel):
     """Pydantic схема для получения пользователя."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: uuid.UUID = Field(description="ID пользователя.")
     email: str = Field(description="Электронная почта пользователя.")
 
-    class Config:
-        json_encoders = {uuid.UUID: str}
-        from_attributes = True
-
 
 class UserLoginSchema(BaseModel):
     """Pydantic схема для авторизации пользователя."""
@@ -28,6 +28,11 @@ class UserLoginSchema(BaseModel):
     email: str = Field(description="Электронная почта пользователя.")
     password: str = Field(description="Пароль пользователя.")
 
+    @cached_property
+    def password_bytes(self) -> bytes:
+        """Пароль пользователя в кодировке UTF-8."""
+        return self.password.encode()
+
 
 class UserCreateSchema(BaseModel):
     """Pydantic схема для создания пользователя."""
@@ -35,6 +40,11 @@ class UserCreateSchema(BaseModel):
     email: str = Field(description="Электронная почта пользователя.")
     password: str = Field(description="Пароль пользователя.")
 
+    @cached_property
+    def password_bytes(self) -> bytes:
+        """Пароль пользователя в кодировке UTF-8."""
+        return self.password.encode()
+
 
 class UserCreateRepositorySchema(BaseModel):
     """Pydantic схема для создания пользователя в БД."""
@@ -129,6 +139,8 @@ class UsersQuerySchema(PaginationBaseSchema):
     списка пользователей от имени администратора.
     """
 
+    model_config = ConfigDict(extra="forbid")
+
     id: uuid.UUID | None = Field(
         default=None,
         description="ID пользователя.",
@@ -148,6 +160,3 @@ class UsersQuerySchema(PaginationBaseSchema):
             "По умолчанию — от новых к старым."
         ),
     )
-
-    class Config:
-        extra = "forbid"
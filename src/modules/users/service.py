@@ -2,14 +2,16 @@
 
 import uuid
 
+from fastapi.concurrency import run_in_threadpool
 from loguru import logger
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.modules.users.schemas as schemas
 from src.core import exceptions
-from src.core.base import BaseService
-from src.core.services import HashService
+from src.core.base import AsyncInsertQueue, BaseService
+from src.core.services import HashService, LoginCacheService
+from src.core.settings import settings
 from src.modules.users.models import UserModel
 from src.modules.users.repository import UserRepository
 
@@ -38,6 +40,10 @@ class UserService(
         """
         Создать пользователя в БД.
 
+        Если включен `ASYNC_INSERT`, пользователь добавляется в БД пакетом
+        вместе с пользователями из других запросов в отдельной транзакции,
+        которая коммитится независимо от `get_uow`.
+
         Args:
             session (AsyncSession): Сессия для работы с базой данных.
             data (UserCreateSchema | UserCreateAdminSchema):
@@ -50,23 +56,41 @@ class UserService(
             ConflictException: Пользователь уже существует.
         """
 
-        logger.info(f"Создание пользователя: {data}")
+        logger.info("Создание пользователя: {}", data.email)
 
         try:
             # Хэширование пароля
-            hashed_password = HashService.generate(data.password)
+            hashed_password = await run_in_threadpool(
+                HashService.generate,
+                data.password_bytes,
+            )
             data = schemas.UserCreateRepositorySchema(
                 email=data.email,
                 hashed_password=hashed_password,
             )
 
+            # Добавление пользователя в БД пакетом вместе с другими запросами
+            if settings.ASYNC_INSERT:
+                queue = AsyncInsertQueue.get_for_repository(cls.repository)
+                user = await queue.submit(data.model_dump(exclude_unset=True))
+
             # Добавление пользователя в БД
-            user = await cls.repository.create(
-                session=session,
-                obj_in=data,
+            else:
+                user = await cls.repository.create(
+                    session=session,
+                    obj_in=data,
+                )
+                if user is None:
+                    raise exceptions.ConflictException()
+
+                await session.flush()
+
+            # Данные получены из БД, поэтому схема собирается без валидации
+            return schemas.UserGetAdminSchema.model_construct(
+                id=user.id,
+                email=user.email,
+                is_admin=user.is_admin,
             )
-            await session.commit()
-            return schemas.UserGetAdminSchema.model_validate(user)
 
         except IntegrityError as ex:
             raise exceptions.ConflictException(exc=ex)
@@ -96,31 +120,70 @@ class UserService(
             ConflictException: Пользователь с такими данными уже существует.
         """
 
-        logger.info(f"Обновление пользователя: {user_id} - {data}")
-
-        # Поиск пользователя в БД
-        await cls.get_by_id(session, user_id)
+        logger.info("Обновление пользователя: {} - {}", user_id, data.email)
 
         hashed_password = None
         if data.password:
-            hashed_password = HashService.generate(data.password)
+            hashed_password = await run_in_threadpool(
+                HashService.generate,
+                data.password,
+            )
 
-        # Обновление пользователя в БД
+        update_data = schemas.UserUpdateRepositoryAdminSchema(
+            email=data.email,
+            hashed_password=hashed_password,
+            is_admin=data.is_admin
+            if isinstance(data, schemas.UserUpdateAdminSchema)
+            else None,
+        ).model_dump(exclude_none=True)
+
+        # Нечего обновлять, возвращаем текущие данные пользователя
+        if not update_data:
+            return await cls.get_by_id(session, user_id)
+
+        # Обновление пользователя в БД, отсутствие определяется по RETURNING
         try:
             updated_user = await UserRepository.update(
                 UserModel.id == user_id,
                 session=session,
-                obj_in=schemas.UserUpdateRepositoryAdminSchema(
-                    email=data.email,
-                    hashed_password=hashed_password,
-                    is_admin=data.is_admin
-                    if isinstance(data, schemas.UserUpdateAdminSchema)
-                    else None,
-                ),
+                obj_in=update_data,
             )
-            await session.commit()
+            await session.flush()
+
+        except NoResultFound:
+            raise exceptions.NotFoundException()
 
         except IntegrityError as ex:
             raise exceptions.ConflictException(exc=ex)
 
-        return schemas.UserGetAdminSchema.model_validate(updated_user)
+        # Сброс кэша авторизаций со старыми данными пользователя
+        LoginCacheService.invalidate(user_id)
+
+        return schemas.UserGetAdminSchema.model_construct(
+            id=updated_user.id,
+            email=updated_user.email,
+            is_admin=updated_user.is_admin,
+        )
+
+    # MARK: Delete
+    @classmethod
+    async def delete(
+        cls,
+        session: AsyncSession,
+        id: uuid.UUID,
+    ):
+        """
+        Удалить пользователя.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            id (uuid.UUID): ID пользователя.
+
+        Raises:
+            NotFoundException: Пользователь не найден.
+        """
+
+        await super().delete(session, id)
+
+        # Сброс кэша авторизаций удаленного пользователя
+        LoginCacheService.invalidate(id)
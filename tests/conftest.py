@@ -1,15 +1,16 @@
 """Основной модуль `conftest` для всех тестов."""
 
 import asyncio
+import os
 import sys
 import uuid
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Awaitable, Callable
 
 import pytest
 import pytest_asyncio
 from faker import Faker
-from sqlalchemy import NullPool
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
@@ -36,52 +37,93 @@ async def engine(request) -> AsyncGenerator[AsyncEngine, None]:
     Область действия `module` задается, поскольку каждый модуль c тестами
     выполняется в отдельном процессе pytest, чтобы гарантировать, что
     он подключается к соответствующей базе данных.
+
+    Соединения переиспользуются через пул, чтобы не устанавливать
+    новое подключение к Postgres для каждого теста, а подготовленные
+    выражения кэшируются в соединениях и повторно не разбираются Postgres.
     """
 
     engine = create_async_engine(
         url=settings.DATABASE_URL,
-        poolclass=NullPool,
+        pool_size=min(os.cpu_count() or 1, 8),
+        max_overflow=0,
+        pool_pre_ping=False,
+        pool_recycle=-1,
+        connect_args={
+            "prepared_statement_cache_size": 512,
+            "statement_cache_size": 512,
+        },
     )
 
     yield engine
 
+    await engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Фабрика сессий, общая для всех тестов модуля.
+
+    Сессии присоединяются к транзакции соединения,
+    создавая собственные точки сохранения.
+    """
+
+    return async_sessionmaker(
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+
+@pytest_asyncio.fixture(scope="module")
+async def connection(engine: AsyncEngine) -> AsyncGenerator[AsyncConnection, None]:
+    """
+    Создать соединение с Postgres и начать внешнюю транзакцию,
+    общую для всех тестов модуля.
+
+    Коммит внешней транзакции никогда не выполняется,
+    после завершения тестов модуля она откатывается.
+    """
+
+    async with engine.connect() as conn:
+        await conn.begin()
+
+        yield conn
+
+        await conn.rollback()
+
 
 @pytest.fixture(scope="function")
-async def session(engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+async def session(
+    connection: AsyncConnection,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncGenerator[AsyncSession, None]:
     """
-    Создать соединение с Postgres, начать транзакцию,
-    а затем привязать это соединение к сессии с вложенной транзакцией.
+    Начать вложенную транзакцию в соединении модуля,
+    а затем привязать это соединение к сессии.
 
     Вложенная транзакция обеспечивает изоляцию внутри тестов, позволяя
-    фиксировать изменения во внутренней транзакции так, чтобы они были
-    видны только для тестов, где она используется, но не фиксировать их
-    в БД полностью, поскольку коммит внешней транзакции
-    никогда не будет выполнен.
+    фиксировать изменения в сессии так, чтобы они были видны только для
+    тестов, где она используется, но не фиксировать их в БД полностью.
+    Коммит и откат сессии затрагивают только ее собственные точки сохранения
+    благодаря `join_transaction_mode="create_savepoint"`.
 
     Параметр `scope="function"` обеспечивает запуск этой фикстуры перед запуском каждого
     теста. Так что после запуска каждого теста, данные в БД откатываются.
     Каждый тест работает изолированно от других.
 
-    Используется движок, соответствующий процессу `pytest`.
+    Используется соединение, соответствующее процессу `pytest`.
     """
 
-    AsyncSession = async_sessionmaker(
-        bind=engine,
-        expire_on_commit=False,
-        autocommit=False,
-        autoflush=False,
-    )
+    nested_tsx = await connection.begin_nested()
 
-    async with engine.connect() as conn:
-        tsx = await conn.begin()
-        async with AsyncSession(bind=conn) as session:
-            nested_tsx = await conn.begin_nested()
-
-            yield session
+    async with session_factory(bind=connection) as session:
+        yield session
 
-            if nested_tsx.is_active:
-                await nested_tsx.rollback()
-            await tsx.rollback()
+    if nested_tsx.is_active:
+        await nested_tsx.rollback()
 
 
 @pytest.fixture()
@@ -100,69 +142,126 @@ async def task_session(
 
 # MARK: Loop
 @pytest.fixture(scope="session")
-def event_loop(request):
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
     """
-    Фикстура для создания и закрытия event loop.
+    Политика event loop для всех тестов.
+
+    Используется `uvloop`, как и при запуске приложения,
+    кроме Windows, где он не поддерживается.
     """
 
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+    if sys.platform == "win32":
+        return asyncio.DefaultEventLoopPolicy()
 
+    import uvloop
 
-# MARK: Output
-@pytest.fixture(autouse=True, scope="session")
-def output_to_stdout():
+    return uvloop.EventLoopPolicy()
+
+
+# MARK: Users
+@pytest.fixture(scope="session")
+def fake_pool() -> dict[str, list[str]]:
     """
-    Перенаправить `stdout` в `stderr`,
-    для вывода логов при отладки в `pytest-xdist`.
+    Заранее сгенерированные уникальные email и пароли
+    для фикстур, создающих пользователей.
     """
 
-    sys.stdout = sys.stderr
+    return {
+        "emails": [faker.unique.email() for _ in range(2000)],
+        "passwords": [faker.password() for _ in range(2000)],
+    }
+
+
+@pytest.fixture(scope="session")
+def fixture_password_hash() -> str:
+    """
+    Хэш пароля, общий для пользователей из фикстур.
+
+    Хэширование argon2id намеренно медленное,
+    поэтому хэш вычисляется один раз за сессию.
+    """
+
+    return HashService.generate("test-password-fixed")
+
+
+@pytest.fixture
+def bulk_users(
+    session: AsyncSession,
+) -> Callable[[list[UserModel]], Awaitable[list[UserModel]]]:
+    """
+    Добавить несколько пользователей в БД одним `flush`.
+
+    Коммит не выполняется, изменения откатываются
+    вместе с вложенной транзакцией теста.
+    """
+
+    async def add_users(users: list[UserModel]) -> list[UserModel]:
+        session.add_all(users)
+        await session.flush()
+
+        return users
+
+    return add_users
 
 
-# MARK: Users
 @pytest_asyncio.fixture
-async def user_db(session: AsyncSession) -> UserModel:
-    """Добавить пользователя в БД."""
+async def users_db(
+    bulk_users: Callable[[list[UserModel]], Awaitable[list[UserModel]]],
+    fake_pool: dict[str, list[str]],
+    fixture_password_hash: str,
+) -> tuple[UserModel, UserModel]:
+    """
+    Добавить в БД пользователя и пользователя-администратора.
 
-    user_db = UserModel(
-        id=str(uuid.uuid4()),
-        email=faker.email(),
-        hashed_password=HashService.generate(faker.password()),
+    Оба пользователя добавляются одним запросом,
+    даже если тесту нужен только один из них.
+    """
+
+    user, user_admin = await bulk_users(
+        [
+            UserModel(
+                id=uuid.uuid4(),
+                email=fake_pool["emails"].pop(),
+                hashed_password=fixture_password_hash,
+            ),
+            UserModel(
+                id=uuid.uuid4(),
+                email=fake_pool["emails"].pop(),
+                hashed_password=fixture_password_hash,
+                is_admin=True,
+            ),
+        ],
     )
-    session.add(user_db)
-    await session.commit()
 
-    return user_db
+    return user, user_admin
 
 
 @pytest_asyncio.fixture
-async def user_admin_db(session: AsyncSession) -> UserModel:
-    """Добавить пользователя-администратора в БД."""
+async def user_db(users_db: tuple[UserModel, UserModel]) -> UserModel:
+    """Добавить пользователя в БД."""
 
-    user_admin = UserModel(
-        id=str(uuid.uuid4()),
-        email=faker.email(),
-        hashed_password=HashService.generate(faker.password()),
-        is_admin=True,
-    )
-    session.add(user_admin)
-    await session.commit()
+    return users_db[0]
+
+
+@pytest_asyncio.fixture
+async def user_admin_db(users_db: tuple[UserModel, UserModel]) -> UserModel:
+    """Добавить пользователя-администратора в БД."""
 
-    return user_admin
+    return users_db[1]
 
 
 @pytest_asyncio.fixture
-async def user_create_data() -> user_schemas.UserCreateAdminSchema:
+async def user_create_data(
+    fake_pool: dict[str, list[str]],
+) -> user_schemas.UserCreateAdminSchema:
     """
     Подготовленные данные для создания
     пользователя в БД администратором.
     """
 
     return user_schemas.UserCreateAdminSchema(
-        email=faker.email(),
-        password=faker.password(),
+        email=fake_pool["emails"].pop(),
+        password=fake_pool["passwords"].pop(),
         is_admin=False,
     )
 
@@ -1,14 +1,21 @@
 """Модуль для тестирования роутера src.users.routers.auth_router"""
 
+import hashlib
+
 import httpx
+import jwt
+import pytest_asyncio
 from fastapi import status
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.modules.auth.schemas as auth_schemas
 import src.modules.users.schemas as user_schemas
+from src.core import constants
 from src.core.services import HashService
+from src.core.settings import settings
 from src.modules.auth import auth_router
-from src.modules.users import UserRepository
+from src.modules.users import UserModel, UserRepository
 from tests.conftest import faker
 from tests.integration.conftest import BaseTestRouter
 
@@ -45,11 +52,36 @@ class TestAuthRouter(BaseTestRouter):
         assert tokens.expires_at is not None
         assert tokens.token_type == "Bearer"
 
-        user_db = await UserRepository.get_one_or_none(
-            session=session,
-            email=schema.email,
+        # Токен выдан добавленному пользователю
+        payload = jwt.decode(
+            jwt=tokens.access_token.removeprefix("Bearer "),
+            key=settings.JWT_ACCESS_SECRET_BYTES,
+            algorithms=[constants.ALGORITHM],
+        )
+        user_id = await session.scalar(
+            text("SELECT id FROM users WHERE email = :email"),
+            {"email": schema.email},
         )
-        assert user_db is not None
+        assert str(user_id) == payload["id"]
+
+    async def test_register_conflict(
+        self,
+        router_client: httpx.AsyncClient,
+        user_db: UserModel,
+    ):
+        """Повторная регистрация с тем же email возвращает 409."""
+
+        schema = user_schemas.UserCreateSchema(
+            email=user_db.email,
+            password=faker.password(),
+        )
+
+        response = await router_client.post(
+            url="/auth/register",
+            json=schema.model_dump(),
+        )
+
+        assert response.status_code == status.HTTP_409_CONFLICT
 
     # MARK: Patch
     async def test_login(
@@ -87,6 +119,176 @@ class TestAuthRouter(BaseTestRouter):
         assert tokens.expires_at is not None
         assert tokens.token_type == "Bearer"
 
+    async def test_login_wrong_password(
+        self,
+        router_client: httpx.AsyncClient,
+        session: AsyncSession,
+    ):
+        """Проверка авторизации пользователя с неверным паролем."""
+
+        email, password = faker.email(), faker.password()
+        await UserRepository.create(
+            session=session,
+            obj_in=user_schemas.UserCreateRepositorySchema(
+                email=email,
+                hashed_password=HashService.generate(password),
+            ),
+        )
+
+        schema = user_schemas.UserLoginSchema(
+            email=email,
+            password=password + "wrong",
+        )
+
+        response = await router_client.patch(
+            url="/auth/login",
+            json=schema.model_dump(),
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_login_legacy_hash_upgraded(
+        self,
+        router_client: httpx.AsyncClient,
+        session: AsyncSession,
+    ):
+        """
+        Пользователь с хэшем SHA-256, созданным до перехода на argon2id,
+        может авторизоваться, а его хэш заменяется на argon2id.
+        """
+
+        schema = user_schemas.UserLoginSchema(
+            email=faker.email(),
+            password=faker.password(),
+        )
+        user = await UserRepository.create(
+            session=session,
+            obj_in=user_schemas.UserCreateRepositorySchema(
+                email=schema.email,
+                hashed_password=hashlib.sha256(schema.password_bytes).hexdigest(),
+            ),
+        )
+
+        response = await router_client.patch(
+            url="/auth/login",
+            json=schema.model_dump(),
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        hashed_password = await session.scalar(
+            select(UserModel.hashed_password).where(UserModel.id == user.id),
+        )
+        assert hashed_password.startswith("$argon2id")
+        assert HashService.verify(hashed_password, schema.password_bytes)
+
+    @pytest_asyncio.fixture
+    async def login_user(
+        self,
+        session: AsyncSession,
+    ) -> tuple[UserModel, user_schemas.UserLoginSchema]:
+        """Пользователь в БД и данные для его авторизации."""
+
+        schema = user_schemas.UserLoginSchema(
+            email=faker.email(),
+            password=faker.password(),
+        )
+        user = await UserRepository.create(
+            session=session,
+            obj_in=user_schemas.UserCreateRepositorySchema(
+                email=schema.email,
+                hashed_password=HashService.generate(schema.password),
+            ),
+        )
+
+        return user, schema
+
+    async def test_login_cache_hit(
+        self,
+        router_client: httpx.AsyncClient,
+        login_user: tuple[UserModel, user_schemas.UserLoginSchema],
+        mocker,
+    ):
+        """Повторная авторизация с теми же данными не проверяет пароль."""
+
+        _, schema = login_user
+
+        response = await router_client.patch(
+            url="/auth/login",
+            json=schema.model_dump(),
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        verify = mocker.spy(HashService, "verify")
+
+        response = await router_client.patch(
+            url="/auth/login",
+            json=schema.model_dump(),
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert verify.call_count == 0
+
+    async def test_login_cache_password_changed(
+        self,
+        router_client: httpx.AsyncClient,
+        session: AsyncSession,
+        login_user: tuple[UserModel, user_schemas.UserLoginSchema],
+    ):
+        """
+        Авторизация из кэша отклоняется после смены пароля,
+        даже если кэш не был сброшен в текущем процессе.
+        """
+
+        user, schema = login_user
+
+        response = await router_client.patch(
+            url="/auth/login",
+            json=schema.model_dump(),
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        await UserRepository.update(
+            UserModel.id == user.id,
+            session=session,
+            obj_in={"hashed_password": HashService.generate(faker.password())},
+        )
+
+        response = await router_client.patch(
+            url="/auth/login",
+            json=schema.model_dump(),
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_login_cache_user_deleted(
+        self,
+        router_client: httpx.AsyncClient,
+        session: AsyncSession,
+        login_user: tuple[UserModel, user_schemas.UserLoginSchema],
+    ):
+        """
+        Авторизация из кэша отклоняется после удаления пользователя,
+        даже если кэш не был сброшен в текущем процессе.
+        """
+
+        user, schema = login_user
+
+        response = await router_client.patch(
+            url="/auth/login",
+            json=schema.model_dump(),
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        await UserRepository.delete(session=session, id=user.id)
+
+        response = await router_client.patch(
+            url="/auth/login",
+            json=schema.model_dump(),
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
     async def test_refresh_tokens(
         self,
         router_client: httpx.AsyncClient,
@@ -3,6 +3,7 @@
 from typing import AsyncGenerator
 
 import httpx
+import pytest
 import pytest_asyncio
 from fastapi import APIRouter, FastAPI
 
@@ -14,23 +15,50 @@ class BaseTestRouter:
 
     router: APIRouter
 
-    @pytest_asyncio.fixture(scope="function")
-    async def router_client(self, session) -> AsyncGenerator[httpx.AsyncClient, None]:
-        """
-        `AsyncGenerator` для экземпляра `httpx.AsyncClient`.
-
-        Конфигурирует `httpx.ASGITransport` для перенаправления всех запросов
-        напрямую в API с использованием протокола ASGI.
-        """
+    @pytest.fixture(scope="class")
+    def router_app(self) -> FastAPI:
+        """Приложение с тестируемым роутером, общее для тестов класса."""
 
         app = FastAPI()
 
         app.include_router(self.router)
 
-        app.dependency_overrides[get_session] = lambda: session
+        return app
+
+    @pytest_asyncio.fixture(scope="class")
+    async def router_transport_client(
+        self,
+        router_app: FastAPI,
+    ) -> AsyncGenerator[httpx.AsyncClient, None]:
+        """
+        `AsyncGenerator` для экземпляра `httpx.AsyncClient`, общего для тестов класса.
+
+        Конфигурирует `httpx.ASGITransport` для перенаправления всех запросов
+        напрямую в API с использованием протокола ASGI.
+        """
 
-        transport = httpx.ASGITransport(app=app)
+        transport = httpx.ASGITransport(app=router_app)
         async with httpx.AsyncClient(
             transport=transport, base_url="http://test"
         ) as async_client:
             yield async_client
+
+    @pytest_asyncio.fixture(scope="function")
+    async def router_client(
+        self,
+        router_app: FastAPI,
+        router_transport_client: httpx.AsyncClient,
+        session,
+    ) -> AsyncGenerator[httpx.AsyncClient, None]:
+        """
+        Клиент для тестирования роутера с сессией текущего теста.
+
+        Изоляция тестов обеспечивается сессией,
+        которая подменяется в приложении для каждого теста.
+        """
+
+        router_app.dependency_overrides[get_session] = lambda: session
+
+        yield router_transport_client
+
+        router_app.dependency_overrides.clear()
@@ -0,0 +1,168 @@
+"""Модуль для тестирования пакетной вставки src.core.base.insert_queue"""
+
+import asyncio
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker
+
+import src.modules.users.schemas as user_schemas
+from src.core import exceptions
+from src.core.base import AsyncInsertQueue, AsyncInsertQueueClosedError
+from src.core.settings import settings
+from src.modules.users import UserModel, UserRepository, UserService
+from tests.conftest import faker
+
+# Ограничение ожидания результата, чтобы зависший вызов не блокировал тесты
+SUBMIT_TIMEOUT_SECONDS = 5
+
+
+class TestAsyncInsertQueue:
+    """Класс для тестирования очереди пакетной вставки."""
+
+    @pytest_asyncio.fixture
+    async def insert_queue(
+        self,
+        session: AsyncSession,
+        connection: AsyncConnection,
+        session_factory: async_sessionmaker[AsyncSession],
+        mocker,
+    ) -> AsyncGenerator[AsyncInsertQueue, None]:
+        """
+        Очередь пользователей, добавляющая пакеты в соединение теста.
+
+        Коммит пакета фиксирует только точку сохранения,
+        поэтому записи откатываются вместе с транзакцией теста.
+        """
+
+        queue = AsyncInsertQueue(
+            UserRepository,
+            session_factory=lambda: session_factory(bind=connection),
+        )
+        mocker.patch.dict(AsyncInsertQueue._queues, {UserRepository: queue})
+
+        yield queue
+
+        await queue.close()
+
+    @staticmethod
+    def user_data() -> dict[str, str]:
+        """Данные для создания пользователя в БД."""
+
+        return {"email": faker.unique.email(), "hashed_password": "hash"}
+
+    async def test_submit_batches(
+        self,
+        insert_queue: AsyncInsertQueue,
+        mocker,
+    ):
+        """Записи из одновременных вызовов добавляются одним пакетом."""
+
+        create_bulk = mocker.spy(UserRepository, "create_bulk")
+        data = [self.user_data() for _ in range(3)]
+
+        users = await asyncio.wait_for(
+            asyncio.gather(*(insert_queue.submit(item) for item in data)),
+            SUBMIT_TIMEOUT_SECONDS,
+        )
+
+        assert create_bulk.call_count == 1
+        assert [user.email for user in users] == [item["email"] for item in data]
+        assert all(user.id is not None for user in users)
+
+    async def test_submit_falls_back_per_item(
+        self,
+        insert_queue: AsyncInsertQueue,
+        user_db: UserModel,
+        mocker,
+    ):
+        """
+        Если пакет не удалось добавить, записи добавляются по одной
+        и ошибку получает только вызов с некорректной записью.
+        """
+
+        create_bulk = mocker.spy(UserRepository, "create_bulk")
+        data = [
+            self.user_data(),
+            {"email": user_db.email, "hashed_password": "hash"},
+            self.user_data(),
+        ]
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *(insert_queue.submit(item) for item in data),
+                return_exceptions=True,
+            ),
+            SUBMIT_TIMEOUT_SECONDS,
+        )
+
+        assert create_bulk.call_count == 1 + len(data)
+        assert isinstance(results[1], IntegrityError)
+        assert results[0].email == data[0]["email"]
+        assert results[2].email == data[2]["email"]
+
+    async def test_user_service_create_conflict(
+        self,
+        insert_queue: AsyncInsertQueue,
+        session: AsyncSession,
+        user_db: UserModel,
+        mocker,
+    ):
+        """Конфликт при пакетной вставке возвращается как `ConflictException`."""
+
+        mocker.patch.object(settings, "ASYNC_INSERT", True)
+        schema = user_schemas.UserCreateSchema(
+            email=user_db.email,
+            password=faker.password(),
+        )
+
+        with pytest.raises(exceptions.ConflictException):
+            await asyncio.wait_for(
+                UserService.create(session, schema),
+                SUBMIT_TIMEOUT_SECONDS,
+            )
+
+    async def test_submit_after_collect_error(
+        self,
+        insert_queue: AsyncInsertQueue,
+        mocker,
+    ):
+        """
+        Ошибка при обработке пакета завершает ожидающие вызовы,
+        а сбор следующих пакетов продолжается.
+        """
+
+        flush = mocker.patch.object(
+            insert_queue,
+            "_flush",
+            side_effect=RuntimeError("flush failed"),
+        )
+
+        with pytest.raises(AsyncInsertQueueClosedError):
+            await asyncio.wait_for(
+                insert_queue.submit(self.user_data()),
+                SUBMIT_TIMEOUT_SECONDS,
+            )
+
+        mocker.stop(flush)
+        data = self.user_data()
+
+        user = await asyncio.wait_for(
+            insert_queue.submit(data),
+            SUBMIT_TIMEOUT_SECONDS,
+        )
+
+        assert user.email == data["email"]
+
+    async def test_close_fails_pending(self, insert_queue: AsyncInsertQueue):
+        """Остановка очереди завершает ожидающие вызовы с ошибкой."""
+
+        submit = asyncio.create_task(insert_queue.submit(self.user_data()))
+        await asyncio.sleep(0)
+
+        await insert_queue.close()
+
+        with pytest.raises(AsyncInsertQueueClosedError):
+            await asyncio.wait_for(submit, SUBMIT_TIMEOUT_SECONDS)
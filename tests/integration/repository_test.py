@@ -0,0 +1,240 @@
+"""Модуль для тестирования репозитория src.core.base.repository"""
+
+import pytest
+from sqlalchemy import ForeignKey, func, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    mapped_column,
+    relationship,
+    selectinload,
+)
+
+from src.core import constants
+from src.core.base import BaseRepository
+from src.modules.users import UserModel, UserRepository
+from tests.conftest import faker
+
+
+# MARK: Models
+class RelationTestBase(DeclarativeBase):
+    """
+    Основной класс моделей со связями для тестов.
+
+    Таблицы создаются внутри транзакции теста и откатываются вместе с ней.
+    """
+
+
+class ParentTestModel(RelationTestBase):
+    """Модель с дочерними записями."""
+
+    __tablename__ = "test_parents"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    children: Mapped[list["ChildTestModel"]] = relationship()
+
+
+class ChildTestModel(RelationTestBase):
+    """Дочерняя запись."""
+
+    __tablename__ = "test_children"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    parent_id: Mapped[int] = mapped_column(ForeignKey("test_parents.id"))
+
+
+class ParentTestRepository(BaseRepository):
+    """Репозиторий для модели с дочерними записями."""
+
+    model = ParentTestModel
+
+
+class TestBaseRepository:
+    """Класс для тестирования базового репозитория на модели пользователей."""
+
+    # MARK: Create
+    async def test_create_bulk_copy(self, session: AsyncSession):
+        """
+        Записи добавляются через COPY со значениями по умолчанию
+        на стороне Python и БД и откатываются вместе с транзакцией.
+        """
+
+        emails = [faker.unique.email() for _ in range(constants.BULK_COPY_THRESHOLD)]
+        data = [{"email": email, "hashed_password": "hash"} for email in emails]
+
+        nested_tsx = await session.begin_nested()
+
+        count = await UserRepository.create_bulk_copy(session=session, data=data)
+        assert count == len(data)
+
+        result = await session.execute(
+            select(UserModel.id, UserModel.is_admin, UserModel.created_at).where(
+                UserModel.email.in_(emails),
+            ),
+        )
+        rows = result.all()
+
+        assert len(rows) == len(data)
+        assert len({row.id for row in rows}) == len(data)
+        assert all(row.is_admin is False for row in rows)
+        assert all(row.created_at is not None for row in rows)
+
+        await nested_tsx.rollback()
+
+        rows_count = await session.scalar(
+            select(func.count())
+            .select_from(UserModel)
+            .where(UserModel.email.in_(emails)),
+        )
+        assert rows_count == 0
+
+    async def test_create_bulk_copy_different_keys(self, session: AsyncSession):
+        """Записи с разными наборами полей отклоняются до вставки."""
+
+        data = [
+            {"email": faker.unique.email(), "hashed_password": "hash"}
+            for _ in range(constants.BULK_COPY_THRESHOLD)
+        ]
+        # У поля нет значения по умолчанию, которое можно было бы подставить
+        del data[-1]["hashed_password"]
+
+        with pytest.raises(ValueError):
+            await UserRepository.create_bulk_copy(session=session, data=data)
+
+    # MARK: Get
+    async def test_get_one_or_none_eager(self, session: AsyncSession):
+        """
+        Связи не загружаются лениво, а загружаются только
+        при явной передаче опций через `eager`.
+        """
+
+        await session.run_sync(
+            lambda sync_session: RelationTestBase.metadata.create_all(
+                sync_session.connection(),
+            ),
+        )
+        session.add(ParentTestModel(id=1, children=[ChildTestModel(id=1)]))
+        await session.flush()
+        session.expunge_all()
+
+        parent = await ParentTestRepository.get_one_or_none(session, id=1)
+        with pytest.raises(InvalidRequestError):
+            parent.children
+        session.expunge_all()
+
+        parent = await ParentTestRepository.get_one_or_none(
+            session,
+            id=1,
+            eager=[selectinload(ParentTestModel.children)],
+        )
+        assert [child.id for child in parent.children] == [1]
+
+    async def test_get_all_filters(self, session: AsyncSession):
+        """
+        Выражения `get_all`, кэшируемые SQLAlchemy, возвращают
+        правильные записи при разных фильтрах в одной сессии.
+        """
+
+        admin, first_user, second_user = await UserRepository.create_bulk(
+            session=session,
+            data=[
+                {
+                    "email": faker.unique.email(),
+                    "hashed_password": "hash",
+                    "is_admin": True,
+                },
+                {
+                    "email": faker.unique.email(),
+                    "hashed_password": "hash",
+                    "is_admin": False,
+                },
+                {
+                    "email": faker.unique.email(),
+                    "hashed_password": "hash",
+                    "is_admin": False,
+                },
+            ],
+        )
+        in_users = UserModel.email.in_(
+            [admin.email, first_user.email, second_user.email],
+        )
+
+        async def get_ids(*args, **kwargs) -> set:
+            users = await UserRepository.get_all(session, *args, **kwargs)
+            return {user.id for user in users}
+
+        # Одинаковые ключи `filter_by` с разными значениями
+        assert await get_ids(email=first_user.email) == {first_user.id}
+        assert await get_ids(email=second_user.email) == {second_user.id}
+
+        # Разные ключи `filter_by`
+        assert await get_ids(0, 10, in_users, is_admin=True) == {admin.id}
+        assert await get_ids(0, 10, in_users, is_admin=False) == {
+            first_user.id,
+            second_user.id,
+        }
+        assert await get_ids(0, 10, in_users, id=admin.id, is_admin=False) == set()
+
+        # Разные значения в `filter`
+        assert await get_ids(0, 10, UserModel.email == admin.email) == {admin.id}
+        assert await get_ids(0, 10, UserModel.email == second_user.email) == {
+            second_user.id,
+        }
+
+        # Разные значения пагинации
+        assert len(await get_ids(0, 1, in_users)) == 1
+        assert len(await get_ids(1, 10, in_users)) == 2
+
+    async def test_stream_page(self, session: AsyncSession):
+        """Поток возвращает все записи частями по `STREAM_YIELD_PER`."""
+
+        rows_count = constants.STREAM_YIELD_PER * 2 + 1
+        users = await UserRepository.create_bulk(
+            session=session,
+            data=[
+                {"email": faker.unique.email(), "hashed_password": "hash"}
+                for _ in range(rows_count)
+            ],
+        )
+        emails = sorted(user.email for user in users)
+
+        result = await UserRepository.stream_page(
+            session=session,
+            stmt=select(UserModel)
+            .where(UserModel.email.in_(emails))
+            .order_by(UserModel.email),
+            limit=None,
+            offset=None,
+        )
+        batches = [batch async for batch in result.partitions()]
+
+        assert [len(batch) for batch in batches] == [
+            constants.STREAM_YIELD_PER,
+            constants.STREAM_YIELD_PER,
+            1,
+        ]
+        assert [user.email for batch in batches for user in batch] == emails
+
+    # MARK: Update
+    async def test_update_object_in_session(self, session: AsyncSession):
+        """Обновление объекта, уже загруженного в сессию, возвращает новые данные."""
+
+        user = await UserRepository.create(
+            session=session,
+            obj_in={"email": faker.unique.email(), "hashed_password": "hash"},
+        )
+        email = faker.unique.email()
+
+        # ID передается строкой, как из параметров пути, поэтому синхронизация
+        # сессии при UPDATE не находит объект и не обновляет его атрибуты
+        updated_user = await UserRepository.update(
+            UserModel.id == str(user.id),
+            session=session,
+            obj_in={"email": email, "is_admin": True},
+        )
+
+        assert updated_user is user
+        assert updated_user.email == email
+        assert updated_user.is_admin is True
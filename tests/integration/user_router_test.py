@@ -1,5 +1,7 @@
 """Модуль для тестирования роутера src.users.routes.user_routes"""
 
+import uuid
+
 import httpx
 from fastapi import status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -34,7 +36,7 @@ class TestUserRouter(BaseTestRouter):
 
         data = user_schemas.UserGetSchema(**response.json())
 
-        assert str(data.id) == user_db.id
+        assert data.id == user_db.id
         assert data.email == user_db.email
 
     async def test_get_user_by_id(
@@ -57,7 +59,7 @@ class TestUserRouter(BaseTestRouter):
 
         data = user_schemas.UserGetSchema(**response.json())
 
-        assert str(data.id) == user_admin_db.id
+        assert data.id == user_admin_db.id
         assert data.email == user_admin_db.email
 
     async def test_get_users_by_admin_no_query(
@@ -124,7 +126,7 @@ class TestUserRouter(BaseTestRouter):
         assert users_data.count == regular_users
 
         assert users_data.data[0].email == user_db.email
-        assert str(users_data.data[0].id) == user_db.id
+        assert users_data.data[0].id == user_db.id
 
     # MARK: Post
     async def test_create_user_by_admin_route(
@@ -176,9 +178,29 @@ class TestUserRouter(BaseTestRouter):
 
         updated_user = user_schemas.UserGetSchema(**response.json())
 
-        assert str(updated_user.id) == user_db.id
+        assert updated_user.id == user_db.id
         assert updated_user.email == user_update_data.email
 
+    async def test_update_current_user_empty(
+        self,
+        router_client: httpx.AsyncClient,
+        user_db: UserModel,
+        user_jwt_tokens: auth_schemas.JWTGetSchema,
+    ):
+        """Обновление без данных возвращает текущие данные пользователя."""
+
+        response = await router_client.patch(
+            url="/users/me",
+            json={},
+            headers={constants.AUTH_HEADER_NAME: user_jwt_tokens.access_token},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        updated_user = user_schemas.UserGetSchema(**response.json())
+
+        assert updated_user.id == user_db.id
+        assert updated_user.email == user_db.email
+
     # MARK: Put
     async def test_update_user_by_admin(
         self,
@@ -202,10 +224,26 @@ class TestUserRouter(BaseTestRouter):
 
         updated_user = user_schemas.UserGetAdminSchema(**response.json())
 
-        assert str(updated_user.id) == user_db.id
+        assert updated_user.id == user_db.id
         assert updated_user.email == user_update_data.email
         assert updated_user.is_admin == user_update_data.is_admin
 
+    async def test_update_user_by_admin_not_found(
+        self,
+        router_client: httpx.AsyncClient,
+        user_update_data: user_schemas.UserUpdateAdminSchema,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+    ):
+        """Обновление несуществующего пользователя возвращает 404."""
+
+        response = await router_client.put(
+            url=f"/users/{uuid.uuid4()}",
+            json=user_update_data.model_dump(exclude_unset=True),
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
     # MARK: Delete
     async def test_delete_user_by_admin(
         self,
@@ -229,3 +267,17 @@ class TestUserRouter(BaseTestRouter):
         )
 
         assert deleted_user is None
+
+    async def test_delete_user_by_admin_not_found(
+        self,
+        router_client: httpx.AsyncClient,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+    ):
+        """Удаление несуществующего пользователя возвращает 404."""
+
+        response = await router_client.delete(
+            url=f"/users/{uuid.uuid4()}",
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND